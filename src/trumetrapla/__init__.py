@@ -1,23 +1,35 @@
 """TruMetraPla - strumenti per analizzare le performance produttive."""
 
-from .data_loader import load_operations_from_excel
-from .metrics import (
-    daily_trend,
-    group_by_employee,
-    group_by_process,
-    summarize_operations,
-)
-from .models import OperationRecord
-from .packaging import (
-    BuildError,
-    build_linux_bundle,
-    build_windows_executable,
-    build_windows_installer,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - solo per i type checker
+    from .data_loader import (
+        iter_operations_from_excel,
+        load_operations_columnar,
+        load_operations_from_excel,
+    )
+    from .metrics import (
+        daily_trend,
+        group_by_employee,
+        group_by_process,
+        summarize_operations,
+    )
+    from .models import OperationRecord
+    from .packaging import (
+        BuildError,
+        build_linux_bundle,
+        build_windows_executable,
+        build_windows_installer,
+    )
 
 __all__ = [
     "OperationRecord",
     "load_operations_from_excel",
+    "iter_operations_from_excel",
+    "load_operations_columnar",
     "summarize_operations",
     "group_by_employee",
     "group_by_process",
@@ -29,3 +41,33 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# I sottomoduli vengono importati al primo accesso: così ``trumetrapla.cli``
+# non paga il caricamento di pandas finché non serve leggere un file Excel.
+_LAZY_EXPORTS = {
+    "OperationRecord": ".models",
+    "load_operations_from_excel": ".data_loader",
+    "iter_operations_from_excel": ".data_loader",
+    "load_operations_columnar": ".data_loader",
+    "summarize_operations": ".metrics",
+    "group_by_employee": ".metrics",
+    "group_by_process": ".metrics",
+    "daily_trend": ".metrics",
+    "BuildError": ".packaging",
+    "build_linux_bundle": ".packaging",
+    "build_windows_executable": ".packaging",
+    "build_windows_installer": ".packaging",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,24 +2,14 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Iterable
 
 import click
 
-from .data_loader import (
-    ColumnMappingError,
-    OPTIONAL_FIELDS,
-    REQUIRED_FIELDS,
-    load_operations_from_excel,
-)
-from .metrics import (
-    daily_trend,
-    group_by_employee,
-    group_by_process,
-    summarize_operations,
-)
 from . import __version__
+from .models import OPTIONAL_FIELDS, REQUIRED_FIELDS
 from .packaging import (
     BuildError,
     build_linux_bundle,
@@ -35,6 +25,8 @@ WELCOME_BANNER = r"""
 
 _CANONICAL_FIELDS = tuple(REQUIRED_FIELDS + OPTIONAL_FIELDS)
 _CANONICAL_FIELD_LIST = ", ".join(_CANONICAL_FIELDS)
+# Con ``case_sensitive=False`` Click restituisce già il nome canonico del campo.
+_CANONICAL_FIELD_CHOICE = click.Choice(_CANONICAL_FIELDS, case_sensitive=False)
 
 
 @click.group(invoke_without_command=True)
@@ -256,9 +248,8 @@ def _launch_gui_from_cli() -> None:
 
 def _prompt_column_mapping() -> dict[str, str]:
     mapping: dict[str, str] = {}
-    choices = click.Choice(_CANONICAL_FIELDS, case_sensitive=False)
     while True:
-        field = click.prompt("Campo canonico", type=choices).casefold()
+        field = click.prompt("Campo canonico", type=_CANONICAL_FIELD_CHOICE)
         column_name = click.prompt("Nome della colonna nel file").strip()
         mapping[field] = column_name
         if not click.confirm("Aggiungere un'altra mappatura?", default=False):
@@ -268,9 +259,8 @@ def _prompt_column_mapping() -> dict[str, str]:
 
 def _prompt_aliases() -> dict[str, list[str]]:
     aliases: dict[str, list[str]] = {}
-    choices = click.Choice(_CANONICAL_FIELDS, case_sensitive=False)
     while True:
-        field = click.prompt("Campo canonico", type=choices).casefold()
+        field = click.prompt("Campo canonico", type=_CANONICAL_FIELD_CHOICE)
         alias_value = click.prompt("Alias da aggiungere").strip()
         aliases.setdefault(field, []).append(alias_value)
         if not click.confirm("Aggiungere un altro alias?", default=False):
@@ -388,6 +378,9 @@ def _load_records(
     column_mapping: dict[str, str],
     aliases: dict[str, list[str]],
 ) -> list:
+    # Import differito: pandas viene caricato solo quando serve leggere un file.
+    from .data_loader import ColumnMappingError, load_operations_from_excel
+
     try:
         return load_operations_from_excel(
             excel_path,
@@ -402,54 +395,83 @@ def _load_records(
 
 
 def _render_report(records) -> None:
+    from .metrics import (
+        daily_trend,
+        group_by_employee,
+        group_by_process,
+        summarize_operations,
+    )
+
     if not records:
         click.echo("Nessun dato trovato nel file specificato.")
         return
 
+    # Una sola scrittura per sezione invece di una ``click.echo`` per riga.
     summary = summarize_operations(records)
-    click.echo("=== Riepilogo generale ===")
-    click.echo(f"Totale pezzi: {summary.total_quantity}")
-    click.echo(f"Ore lavorate: {summary.total_hours:.2f}")
-    click.echo(f"Produttività media: {summary.throughput:.2f} pezzi/ora")
-    click.echo(f"Dipendenti coinvolti: {summary.employees}")
-    click.echo(f"Processi analizzati: {summary.processes}\n")
-
-    click.echo("=== Performance per dipendente ===")
-    for performance in group_by_employee(records):
-        click.echo(
-            f"- {performance.entity}: {performance.total_quantity} pezzi, "
-            f"{performance.total_hours:.2f} h, {performance.throughput:.2f} pezzi/ora"
+    click.echo(
+        "\n".join(
+            [
+                "=== Riepilogo generale ===",
+                f"Totale pezzi: {summary.total_quantity}",
+                f"Ore lavorate: {summary.total_hours:.2f}",
+                f"Produttività media: {summary.throughput:.2f} pezzi/ora",
+                f"Dipendenti coinvolti: {summary.employees}",
+                f"Processi analizzati: {summary.processes}\n",
+            ]
         )
-    click.echo()
+    )
 
-    click.echo("=== Performance per processo ===")
-    for performance in group_by_process(records):
-        click.echo(
-            f"- {performance.entity}: {performance.total_quantity} pezzi, "
-            f"{performance.total_hours:.2f} h, {performance.throughput:.2f} pezzi/ora"
+    click.echo(
+        "\n".join(
+            [
+                "=== Performance per dipendente ===",
+                *_format_performance_lines(group_by_employee(records)),
+                "",
+            ]
         )
-    click.echo()
+    )
 
-    click.echo("=== Andamento giornaliero ===")
-    for day in daily_trend(records):
-        click.echo(
-            f"- {day.date:%d/%m/%Y}: {day.total_quantity} pezzi in {day.total_hours:.2f} h "
-            f"({day.throughput:.2f} pezzi/ora)"
+    click.echo(
+        "\n".join(
+            [
+                "=== Performance per processo ===",
+                *_format_performance_lines(group_by_process(records)),
+                "",
+            ]
         )
+    )
+
+    click.echo(
+        "\n".join(
+            [
+                "=== Andamento giornaliero ===",
+                *(
+                    f"- {day.date:%d/%m/%Y}: {day.total_quantity} pezzi in "
+                    f"{day.total_hours:.2f} h ({day.throughput:.2f} pezzi/ora)"
+                    for day in daily_trend(records)
+                ),
+            ]
+        )
+    )
+
+
+def _format_performance_lines(performances: Iterable) -> list[str]:
+    return [
+        f"- {performance.entity}: {performance.total_quantity} pezzi, "
+        f"{performance.total_hours:.2f} h, {performance.throughput:.2f} pezzi/ora"
+        for performance in performances
+    ]
 
 
 def _tuples_to_mapping(items: Iterable[tuple[str, str]]) -> dict[str, str]:
-    mapping: dict[str, str] = {}
-    for field, column in items:
-        mapping[field] = column
-    return mapping
+    return dict(items)
 
 
 def _collect_aliases(items: Iterable[tuple[str, str]]) -> dict[str, list[str]]:
-    aliases: dict[str, list[str]] = {}
+    aliases: defaultdict[str, list[str]] = defaultdict(list)
     for field, alias in items:
-        aliases.setdefault(field, []).append(alias)
-    return aliases
+        aliases[field].append(alias)
+    return dict(aliases)
 
 
 if __name__ == "__main__":
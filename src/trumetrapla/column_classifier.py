@@ -25,9 +25,16 @@ from collections import Counter
 import math
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, Mapping, Sequence
 
 _TOKEN_RE = re.compile(r"[\wÀ-ÖØ-öø-ÿ]+", re.UNICODE)
+# One match per line that contains a date-like value anywhere in it.
+_DATE_LINE_RE = re.compile(r"^.*?\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}", re.MULTILINE)
+# Lines made only of a decimal number (after "," has been turned into ".").
+_NUMERIC_LINE_RE = re.compile(
+    r"^[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?$", re.MULTILINE
+)
 
 
 def _tokenize(text: str) -> list[str]:
@@ -36,22 +43,20 @@ def _tokenize(text: str) -> list[str]:
     return [_token.casefold() for _token in _TOKEN_RE.findall(text)]
 
 
-def _flatten_samples(samples: Sequence[str] | None) -> list[str]:
-    flattened: list[str] = []
+def _tokenize_column(header: str, samples: Sequence[str] | None) -> list[str]:
+    """Tokenize a header and its samples with a single regex scan."""
+
     if not samples:
-        return flattened
-    for sample in samples:
-        if not sample:
-            continue
-        flattened.extend(_tokenize(sample))
-    return flattened
+        return _tokenize(header)
+    # "\n" is not a token character, so joining never merges adjacent values.
+    return _tokenize("\n".join([header or "", *(sample for sample in samples if sample)]))
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class _FieldProfile:
     name: str
-    token_counts: Counter[str]
-    total_tokens: int
+    log_probs: dict[str, float]
+    log_unknown: float
 
 
 class NaiveBayesColumnClassifier:
@@ -62,32 +67,46 @@ class NaiveBayesColumnClassifier:
             raise ValueError("training_samples must not be empty")
 
         self._profiles: dict[str, _FieldProfile] = {}
+        counters: dict[str, Counter[str]] = {}
         vocabulary: set[str] = set()
 
         for field, samples in training_samples.items():
-            token_counter: Counter[str] = Counter()
-            for sample in samples:
-                token_counter.update(_tokenize(sample))
-            total = sum(token_counter.values())
-            self._profiles[field] = _FieldProfile(field, token_counter, total)
+            # A single regex scan per field: "\n" is not a token character, so
+            # tokens never span two training samples.
+            tokens = _TOKEN_RE.findall("\n".join(sample for sample in samples if sample))
+            token_counter: Counter[str] = Counter(map(str.casefold, tokens))
+            counters[field] = token_counter
             vocabulary.update(token_counter.keys())
 
         self._vocabulary_size = max(len(vocabulary), 1)
-        self._log_prior = math.log(1 / len(self._profiles))
+        self._log_prior = math.log(1 / len(counters))
+
+        # Laplace-smoothed log-likelihoods only depend on the training data, so
+        # they are tabulated once instead of on every ``score`` call.
+        for field, token_counter in counters.items():
+            denominator = sum(token_counter.values()) + self._vocabulary_size
+            log_probs = {
+                token: math.log((count + 1) / denominator)
+                for token, count in token_counter.items()
+            }
+            self._profiles[field] = _FieldProfile(field, log_probs, math.log(1 / denominator))
 
     def score(self, field: str, *, header: str, samples: Sequence[str] | None = None) -> float:
+        return self.score_tokens(field, _tokenize_column(header, samples))
+
+    def score_tokens(self, field: str, tokens: Sequence[str]) -> float:
+        """Score input that has already been tokenized with :func:`_tokenize`."""
+
         profile = self._profiles[field]
-        tokens = _tokenize(header)
-        tokens.extend(_flatten_samples(samples))
         if not tokens:
             return float("-inf")
 
-        score = self._log_prior
-        denominator = profile.total_tokens + self._vocabulary_size
-        for token in tokens:
-            count = profile.token_counts.get(token, 0)
-            score += math.log((count + 1) / denominator)
-        return score
+        # Out-of-vocabulary tokens (most sample values) all weigh log_unknown,
+        # so they are counted and multiplied instead of summed one by one.
+        log_probs = profile.log_probs
+        known = [log_probs[token] for token in tokens if token in log_probs]
+        unknown_count = len(tokens) - len(known)
+        return self._log_prior + profile.log_unknown * unknown_count + sum(known)
 
     def most_likely_fields(
         self,
@@ -114,29 +133,18 @@ def analyse_samples(samples: Sequence[str] | None) -> dict[str, float]:
     if not samples:
         return {"numeric_ratio": 0.0, "date_like_ratio": 0.0, "text_length": 0.0}
 
-    numeric_matches = 0
-    date_matches = 0
-    total_length = 0
-
-    date_pattern = re.compile(r"\d{1,4}[-/.]" r"\d{1,2}[-/.]\d{1,4}")
-
-    for sample in samples:
-        if sample is None:
-            continue
-        text = str(sample).strip()
-        if not text:
-            continue
-        total_length += len(text)
-
-        if date_pattern.search(text):
-            date_matches += 1
-
-        try:
-            float(text.replace(",", "."))
-        except ValueError:
-            pass
-        else:
-            numeric_matches += 1
+    # Samples are stripped, flattened to one line each and joined so that the
+    # date and numeric checks run as two C-level regex scans instead of a
+    # Python loop with a ``try/except float()`` per value.
+    texts = [
+        text.replace("\n", " ")
+        for text in (str(sample).strip() for sample in samples if sample is not None)
+        if text
+    ]
+    total_length = sum(map(len, texts))
+    blob = "\n".join(texts)
+    date_matches = len(_DATE_LINE_RE.findall(blob))
+    numeric_matches = len(_NUMERIC_LINE_RE.findall(blob.replace(",", ".")))
 
     total_samples = max(len(samples), 1)
     return {
@@ -146,6 +154,39 @@ def analyse_samples(samples: Sequence[str] | None) -> dict[str, float]:
     }
 
 
+# Weights applied to (date_like_ratio, numeric_ratio, text_length) on top of
+# the classifier score.  Pure numbers are usually not valid dates, while
+# textual fields benefit from actual text content.
+_FIELD_ADJUSTMENTS: dict[str, tuple[float, float, float]] = {
+    "date": (2.5, -1.5, 0.0),
+    "quantity": (-1.0, 3.0, 0.0),
+    "duration_minutes": (-1.0, 3.0, 0.0),
+}
+_TEXT_FIELD_ADJUSTMENT = (0.0, -2.0, 0.002)
+
+# Minimum share of samples that must look numeric/date-like for a column with
+# samples to be considered a candidate for the given field.
+_VIABILITY_THRESHOLDS: dict[str, tuple[str, float]] = {
+    "date": ("date_like_ratio", 0.05),
+    "quantity": ("numeric_ratio", 0.1),
+    "duration_minutes": ("numeric_ratio", 0.1),
+}
+
+
+@lru_cache(maxsize=256)
+def _column_features(
+    header: str, samples: tuple[str, ...]
+) -> tuple[tuple[str, ...], dict[str, float]]:
+    """Tokens and heuristics of a column, shared by every field evaluated on it.
+
+    ``ColumnGuesser.guess`` runs once per canonical field over the same
+    columns, so caching avoids re-tokenizing each header and its samples for
+    every field.  The returned metadata must be treated as read-only.
+    """
+
+    return tuple(_tokenize_column(header, samples)), analyse_samples(samples)
+
+
 class ColumnGuesser:
     """Combine a probabilistic classifier with heuristics."""
 
@@ -159,28 +200,31 @@ class ColumnGuesser:
         header: str,
         samples: Sequence[str] | None,
     ) -> float:
-        metadata = analyse_samples(samples)
-        base_score = self._classifier.score(field, header=header, samples=samples)
-        if not math.isfinite(base_score):
-            base_score = -1_000.0
-
-        score = base_score
-
-        numeric_ratio = metadata["numeric_ratio"]
-        date_ratio = metadata["date_like_ratio"]
-
-        if field == "date":
-            score += 2.5 * date_ratio
-            score -= 1.5 * numeric_ratio  # pure numbers are usually not valid dates
-        elif field in {"quantity", "duration_minutes"}:
-            score += 3.0 * numeric_ratio
-            score -= 1.0 * date_ratio
-        else:
-            # Textual fields benefit from actual text content
-            score += 0.002 * metadata["text_length"]
-            score -= 2.0 * numeric_ratio
+        tokens, metadata = _column_features(header, tuple(samples or ()))
+        return self._score_features(field, tokens, metadata)
 
-        return score
+    def _score_features(
+        self,
+        field: str,
+        tokens: Sequence[str],
+        metadata: Mapping[str, float],
+    ) -> float:
+        # Columns without any token would score -inf: use a finite sentinel so
+        # the heuristics below can still rank them.
+        if tokens:
+            score = self._classifier.score_tokens(field, tokens)
+        else:
+            score = -1_000.0
+
+        date_weight, numeric_weight, text_weight = _FIELD_ADJUSTMENTS.get(
+            field, _TEXT_FIELD_ADJUSTMENT
+        )
+        return (
+            score
+            + date_weight * metadata["date_like_ratio"]
+            + numeric_weight * metadata["numeric_ratio"]
+            + text_weight * metadata["text_length"]
+        )
 
     def guess(
         self,
@@ -192,11 +236,19 @@ class ColumnGuesser:
         best_column: str | None = None
         best_score = float("-inf")
         second_score = float("-inf")
+        threshold = _VIABILITY_THRESHOLDS.get(field)
 
         for header, samples in columns.items():
             if header in already_assigned:
                 continue
-            score = self.evaluate(field=field, header=header, samples=samples)
+            tokens, metadata = _column_features(header, tuple(samples or ()))
+            # Columns whose samples clearly contradict the field are not
+            # candidates at all: skip them before running the classifier.
+            if threshold is not None and samples:
+                metadata_key, minimum_ratio = threshold
+                if metadata[metadata_key] < minimum_ratio:
+                    continue
+            score = self._score_features(field, tokens, metadata)
             if score > best_score:
                 second_score = best_score
                 best_score = score
@@ -280,6 +332,7 @@ DEFAULT_TRAINING_DATA: dict[str, tuple[str, ...]] = {
 }
 
 
+@lru_cache(maxsize=1)
 def build_default_guesser() -> ColumnGuesser:
     classifier = NaiveBayesColumnClassifier(DEFAULT_TRAINING_DATA)
     return ColumnGuesser(classifier)
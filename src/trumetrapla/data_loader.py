@@ -2,23 +2,36 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain, islice, repeat
 from pathlib import Path
-
-import pandas as pd
+import re
+from typing import TYPE_CHECKING
 
 from .column_classifier import build_default_guesser
-from .models import OperationRecord
+from .models import OPTIONAL_FIELDS, REQUIRED_FIELDS, OperationRecord
+
+# pandas e NumPy vengono importati solo dalle funzioni che leggono i file:
+# la mappatura delle colonne (usata anche dalla GUI all'avvio) non li richiede.
+if TYPE_CHECKING:  # pragma: no cover - solo per i type checker
+    import numpy as np
+    import pandas as pd
+
+_CANONICAL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
 
-REQUIRED_FIELDS = (
+# Campi di :class:`OperationRecord` nell'ordine dei parametri posizionali.
+_RECORD_FIELDS = (
     "date",
     "employee",
     "process",
+    "machine",
+    "process_type",
     "quantity",
     "duration_minutes",
 )
-OPTIONAL_FIELDS = ("machine", "process_type")
-_CANONICAL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
+_RECORD_FIELD_DTYPES = {"quantity": "int64", "duration_minutes": "float64"}
 
 _DEFAULT_COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
     "date": ("data", "date", "giorno"),
@@ -78,20 +91,121 @@ _FIELD_KEYWORDS: dict[str, tuple[str, ...]] = {
 
 _COLUMN_GUESSER = build_default_guesser()
 
+# python-calamine (extra ``calamine``) legge i file xlsx molto più velocemente
+# di openpyxl; se non è installato si usa il motore predefinito di pandas.
+_EXCEL_ENGINE = "calamine" if find_spec("python_calamine") is not None else None
+
+# Righe usate per campionare i valori delle colonne durante la mappatura.
+_PREVIEW_ROWS = 25
+_SAMPLES_PER_COLUMN = 12
+
+# Formati leggibili in streaming con openpyxl; gli altri (es. ``.xls``)
+# passano da ``pd.read_excel``.
+_OPENPYXL_SUFFIXES = frozenset({".xlsx", ".xlsm", ".xltx", ".xltm"})
+
+# Testi che ``pd.read_excel`` considera celle vuote per impostazione predefinita.
+_EXCEL_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
+# Codici di errore che openpyxl restituisce come testo e che ``pd.read_excel``
+# legge come celle vuote.
+_EXCEL_ERROR_CODES = frozenset(
+    {"#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"}
+)
+
 
 class ColumnMappingError(ValueError):
     """Errore sollevato quando le colonne richieste non sono presenti."""
 
 
-def _coerce_text(value: object) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, str):
-        text = value.strip()
-        return "" if text.casefold() == "nan" else text
-    if pd.isna(value):  # type: ignore[arg-type]
-        return ""
-    return str(value).strip()
+def _to_dates(values: pd.Series, date_format: str | None = None) -> pd.Series:
+    """Converte una colonna in oggetti :class:`datetime.date`.
+
+    Le colonne già in formato data (il caso tipico per Excel) non vengono
+    rianalizzate. Le date testuali usano ``date_format`` se indicato,
+    altrimenti il formato dedotto da pandas sul primo valore. La conversione
+    in ``date`` avviene una sola volta per ogni giorno distinto: le righe
+    dello stesso giorno condividono lo stesso oggetto e i valori mancanti
+    diventano ``None``.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, errors="raise", format=date_format)
+    codes, uniques = pd.factorize(values)
+    days = np.append(uniques.date, None)  # il codice -1 (NaT) punta a None
+    return pd.Series(days[codes], index=values.index, dtype=object)
+
+
+def _infer_date_format(values: pd.Series) -> str | None:
+    """Ricava il formato delle date testuali come fa ``pd.to_datetime``.
+
+    pandas deduce il formato dal primo valore non vuoto della colonna; se il
+    valore non è un testo o il formato non è riconoscibile ogni cella viene
+    interpretata singolarmente (``"mixed"``). Restituisce ``None`` se la
+    colonna non contiene valori.
+    """
+
+    import warnings
+
+    from pandas.tseries.api import guess_datetime_format
+
+    present = values.dropna()
+    if present.empty:
+        return None
+    first = present.iloc[0]
+    if not isinstance(first, str):
+        return "mixed"
+    with warnings.catch_warnings():
+        # Es. "13/01/2024" con ``dayfirst=False``: il formato dedotto è
+        # comunque quello che userebbe ``pd.to_datetime``.
+        warnings.simplefilter("ignore", UserWarning)
+        return guess_datetime_format(first) or "mixed"
+
+
+def _sample_values(values: pd.Series) -> list[str]:
+    """Valori di esempio di una colonna, in testo, per il riconoscimento."""
+
+    return values.dropna().astype(str).head(_SAMPLES_PER_COLUMN).tolist()
+
+
+def _coerce_text_series(values: pd.Series) -> pd.Series:
+    """Converte una colonna in testo ripulito: valori mancanti e "nan" diventano "".
+
+    Come per le date, i valori ripetuti (operatori, processi, macchine)
+    condividono un'unica stringa invece di una copia per riga.
+    """
+
+    import pandas as pd
+
+    text = values.astype(object).where(values.notna(), "").astype(str).str.strip()
+    text = text.mask(text.str.casefold() == "nan", "")
+    codes, uniques = pd.factorize(text)
+    return pd.Series(uniques[codes], index=text.index, dtype=object)
 
 
 def load_operations_from_excel(
@@ -118,25 +232,449 @@ def load_operations_from_excel(
             richieste.
     """
 
+    columns = load_operations_columnar(
+        path, sheet_name=sheet_name, column_mapping=column_mapping, aliases=aliases
+    )
+    return _records_from_columns(columns)
+
+
+def load_operations_columnar(
+    path: str | Path,
+    *,
+    sheet_name: int | str | None = 0,
+    column_mapping: Mapping[str, str] | None = None,
+    aliases: Mapping[str, Sequence[str]] | None = None,
+) -> dict[str, np.ndarray]:
+    """Carica i dati di produzione come colonne NumPy invece che come record.
+
+    Esegue le stesse conversioni di :func:`load_operations_from_excel` ma
+    restituisce un array per campo, senza creare un oggetto per riga: utile
+    per aggregazioni vettoriali su fogli di grandi dimensioni.
+
+    Args:
+        path: Percorso del file Excel da leggere.
+        sheet_name: Nome o indice del foglio da analizzare.
+        column_mapping: Mappatura esplicita tra i campi canonici e le colonne del
+            file.
+        aliases: Alias aggiuntivi per il riconoscimento automatico delle colonne.
+
+    Returns:
+        Un dizionario con una chiave per ogni campo di :class:`OperationRecord`
+        (``quantity`` in ``int64``, ``duration_minutes`` in ``float64``, gli
+        altri come array di oggetti) seguita dalle colonne aggiuntive con la
+        loro intestazione originale.
+
+    Raises:
+        ColumnMappingError: se non è possibile determinare tutte le colonne
+            richieste.
+    """
+
+    import numpy as np
+    import pandas as pd
+
     excel_path = Path(path)
     if not excel_path.exists():
         raise FileNotFoundError(f"Il file {excel_path} non esiste")
 
-    data_frame = pd.read_excel(excel_path, sheet_name=sheet_name)
+    data_frame = pd.read_excel(excel_path, sheet_name=sheet_name, engine=_EXCEL_ENGINE)
     if data_frame.empty:
-        return []
+        return {
+            field: np.empty(0, dtype=_RECORD_FIELD_DTYPES.get(field, object))
+            for field in _RECORD_FIELDS
+        }
+
+    resolved_columns = _resolve_frame_columns(
+        data_frame, column_mapping=column_mapping, aliases=aliases
+    )
+    return _columns_from_frame(data_frame, resolved_columns)
+
+
+def iter_operations_from_excel(
+    path: str | Path,
+    *,
+    sheet_name: int | str = 0,
+    column_mapping: Mapping[str, str] | None = None,
+    aliases: Mapping[str, Sequence[str]] | None = None,
+    chunk_size: int = 10_000,
+) -> Iterator[OperationRecord]:
+    """Legge i dati di produzione un blocco di righe alla volta.
+
+    A differenza di :func:`load_operations_from_excel` il foglio non viene
+    caricato interamente in memoria: le righe sono lette in streaming con
+    openpyxl in modalità sola lettura e convertite in :class:`OperationRecord`
+    a blocchi di ``chunk_size`` righe. Una prima lettura ricava il tipo che
+    pandas assegnerebbe a ogni colonna dell'intero foglio (es. numeri interi
+    con celle vuote letti come ``float``); la seconda converte i blocchi con
+    quei tipi, con la mappatura delle colonne ricavata dalle prime righe e con
+    il formato delle date testuali dedotto dal primo valore presente. Il
+    risultato coincide così con quello di :func:`load_operations_from_excel`
+    qualunque sia ``chunk_size``.
+
+    I formati non leggibili con openpyxl (es. ``.xls``, ``.xlsb``) vengono
+    caricati per intero con :func:`load_operations_from_excel`.
+
+    Args:
+        path: Percorso del file Excel da leggere.
+        sheet_name: Nome o indice del foglio da analizzare.
+        column_mapping: Mappatura esplicita tra i campi canonici e le colonne del
+            file.
+        aliases: Alias aggiuntivi per il riconoscimento automatico delle colonne.
+        chunk_size: Numero di righe elaborate per blocco.
+
+    Yields:
+        Le lavorazioni nell'ordine del file di origine.
+
+    Raises:
+        ColumnMappingError: se non è possibile determinare tutte le colonne
+            richieste.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve essere un intero positivo")
+
+    excel_path = Path(path)
+    if not excel_path.exists():
+        raise FileNotFoundError(f"Il file {excel_path} non esiste")
+
+    if excel_path.suffix.lower() not in _OPENPYXL_SUFFIXES:
+        yield from load_operations_from_excel(
+            excel_path,
+            sheet_name=sheet_name,
+            column_mapping=column_mapping,
+            aliases=aliases,
+        )
+        return
+
+    column_kinds = _sheet_column_kinds(excel_path, sheet_name)
+    if column_kinds is None:
+        return
+
+    rows = _drop_trailing_blank_rows(_iter_sheet_rows(excel_path, sheet_name))
+    header = _header_names(next(rows))
+
+    # La mappatura usa le stesse righe di anteprima di ``load_operations_from_excel``,
+    # così il risultato non dipende da ``chunk_size``.
+    preview = list(islice(rows, _PREVIEW_ROWS))
+    resolved_columns = _resolve_frame_columns(
+        _chunk_frame(preview, header, column_kinds),
+        column_mapping=column_mapping,
+        aliases=aliases,
+    )
+
+    rows = chain(preview, rows)
+    date_format = None
+    while chunk := list(islice(rows, chunk_size)):
+        frame = _chunk_frame(chunk, header, column_kinds)
+        if date_format is None:
+            date_format = _infer_date_format(frame[resolved_columns["date"]])
+        yield from _records_from_columns(
+            _columns_from_frame(frame, resolved_columns, date_format=date_format)
+        )
+
+
+def preview_excel_columns(
+    path: str | Path, *, sheet_name: int | str = 0
+) -> tuple[list[object], dict[object, list[str]]]:
+    """Legge intestazioni e valori di esempio senza caricare l'intero foglio.
+
+    Per i file ``.xlsx`` vengono lette in streaming solo la riga di
+    intestazione e le prime righe di dati, convertite come farebbe
+    ``pd.read_excel(..., nrows=25)``. I tipi delle colonne sono dedotti da
+    queste sole righe: :func:`load_operations_from_excel` li deduce
+    dall'intero foglio, quindi i campioni possono differire (es. ``10`` e
+    ``10.0`` se la colonna ha celle vuote più in basso).
+
+    Returns:
+        Le intestazioni del foglio e, per ognuna, fino a dodici valori non
+        vuoti convertiti in testo.
+    """
+
+    excel_path = Path(path)
+    if excel_path.suffix.lower() not in _OPENPYXL_SUFFIXES:
+        import pandas as pd
+
+        preview = pd.read_excel(
+            excel_path, sheet_name=sheet_name, nrows=_PREVIEW_ROWS, engine=_EXCEL_ENGINE
+        )
+    else:
+        rows = _drop_trailing_blank_rows(_iter_sheet_rows(excel_path, sheet_name))
+        try:
+            header_row = next(rows, None)
+            if header_row is None:
+                return [], {}
+            header = _header_names(header_row)
+            preview = _parse_rows(list(islice(rows, _PREVIEW_ROWS)), header)
+        finally:
+            rows.close()
+    columns = list(preview.columns)
+    return columns, {column: _sample_values(preview[column]) for column in columns}
+
+
+def _excel_cell(value: object) -> object:
+    """Converte un valore di openpyxl come fa il lettore Excel di pandas.
+
+    Celle vuote diventano ``""``, i numeri interi ``int`` e i codici di errore
+    valori mancanti.
+    """
+
+    if value is None:
+        return ""
+    if type(value) is float:
+        return int(value) if value.is_integer() else value
+    if type(value) is str and value in _EXCEL_ERROR_CODES:
+        return float("nan")
+    return value
+
+
+def _parse_rows(rows: list[tuple[object, ...]], header: list[object]) -> pd.DataFrame:
+    """Costruisce un DataFrame dalle righe grezze con il parser di ``pd.read_excel``.
+
+    Valori mancanti e tipi delle colonne sono dedotti come in
+    ``pd.read_excel``, ma solo sulle righe fornite.
+    """
+
+    import pandas as pd
+    from pandas.io.parsers import TextParser
+
+    if not rows:
+        return pd.DataFrame(columns=header)
+    width = len(header)
+    data = [
+        [_excel_cell(value) for value in row[:width]] + [""] * (width - len(row))
+        for row in rows
+    ]
+    return TextParser(data, names=header, header=None, skip_blank_lines=False).read()
+
+
+_EXCEL_TRUE_STRINGS = frozenset({"True", "TRUE", "true"})
+_EXCEL_FALSE_STRINGS = frozenset({"False", "FALSE", "false"})
+
+
+@lru_cache(maxsize=4096)
+def _text_category(value: str) -> str:
+    """Categoria di un testo per l'inferenza dei tipi di ``pd.read_excel``."""
+
+    import pandas as pd
+
+    if value in _EXCEL_TRUE_STRINGS or value in _EXCEL_FALSE_STRINGS:
+        return "bool_text"
+    if value.strip()[:1] not in "0123456789+-.iI":
+        return "text"
+    number = pd.to_numeric(pd.Series([value], dtype=object), errors="coerce")
+    if number.isna().all():
+        return "text"
+    return "int" if pd.api.types.is_integer_dtype(number) else "float"
+
+
+def _cell_category(value: object) -> str:
+    """Classe di una cella rispetto all'inferenza dei tipi di ``pd.read_excel``.
+
+    Il tipo che pandas assegna a una colonna dipende solo da quali classi di
+    valori contiene (interi, decimali, booleani, testi, date, celle vuote).
+    """
+
+    if value is None or value == "":
+        return "na"
+    kind = type(value)
+    if kind is str:
+        if value in _EXCEL_NA_VALUES or value in _EXCEL_ERROR_CODES:
+            return "na"
+        return _text_category(value)
+    if kind is float:
+        if value != value:
+            return "na"
+        return "int" if value.is_integer() else "float"
+    if kind is bool:
+        return "bool"
+    if kind is int:
+        return "int"
+    return kind.__name__
+
+
+def _sheet_column_kinds(
+    excel_path: Path, sheet_name: int | str
+) -> dict[object, str] | None:
+    """Tipo che ``pd.read_excel`` assegnerebbe a ogni colonna dell'intero foglio.
+
+    Il foglio viene letto in streaming conservando, per ogni colonna, una sola
+    cella per classe di valori; il tipo si ottiene poi passando queste celle
+    al parser di pandas. Restituisce ``None`` se il foglio non ha intestazione
+    o righe di dati.
+    """
+
+    rows = _drop_trailing_blank_rows(_iter_sheet_rows(excel_path, sheet_name))
+    try:
+        header_row = next(rows, None)
+        if header_row is None:
+            return None
+        header = _header_names(header_row)
+        width = len(header)
+        examples: list[dict[str, object]] = [{} for _ in header]
+        has_rows = False
+        for row in rows:
+            has_rows = True
+            for index, value in enumerate(row[:width]):
+                column_examples = examples[index]
+                category = _cell_category(value)
+                if category not in column_examples:
+                    column_examples[category] = value
+            for index in range(len(row), width):
+                examples[index].setdefault("na", None)
+    finally:
+        rows.close()
+    if not has_rows:
+        return None
+    kinds: dict[object, str] = {}
+    for column, column_examples in zip(header, examples):
+        values = list(column_examples.values())
+        parsed = _parse_rows([(value,) for value in values], [column])[column]
+        kind = str(parsed.dtype)
+        if kind == "object" and any(
+            isinstance(value, str) and isinstance(result, bool)
+            for value, result in zip(values, parsed.tolist())
+        ):
+            # Testi "true"/"false" con celle vuote: pandas li converte in
+            # booleani anche se la colonna resta di tipo ``object``.
+            kind = "bool"
+        kinds[column] = kind
+    return kinds
+
+
+def _bool_cell(value: object) -> object:
+    """Converte i testi booleani come fa ``pd.read_excel``."""
+
+    if isinstance(value, str):
+        if value in _EXCEL_TRUE_STRINGS:
+            return True
+        if value in _EXCEL_FALSE_STRINGS:
+            return False
+    return value
+
+
+def _chunk_frame(
+    chunk: list[tuple[object, ...]], header: list[object], column_kinds: Mapping[object, str]
+) -> pd.DataFrame:
+    """Costruisce il DataFrame di un blocco con i tipi dell'intero foglio.
+
+    Ogni blocco viene letto come ``pd.read_excel``; le colonne il cui tipo
+    differisce da quello dell'intero foglio vengono riportate a quel tipo,
+    così ``3`` resta ``3.0`` anche nei blocchi senza celle vuote.
+    """
+
+    import pandas as pd
+
+    frame = _parse_rows(chunk, header)
+    raw: pd.DataFrame | None = None
+    for column in header:
+        kind = column_kinds[column]
+        if kind != "object" and str(frame[column].dtype) == kind:
+            continue
+        if kind in ("int64", "float64"):
+            # Es. booleani in un blocco e decimali in un altro: pandas
+            # converte l'intera colonna in numeri.
+            frame[column] = frame[column].astype(kind)
+            continue
+        # Colonna mista nel foglio: pandas conserva i valori delle celle.
+        if raw is None:
+            width = len(header)
+            raw = pd.DataFrame(
+                [
+                    [_excel_cell(value) for value in row[:width]]
+                    + [""] * (width - len(row))
+                    for row in chunk
+                ],
+                columns=header,
+                dtype=object,
+            )
+            raw = raw.mask(raw.isin(_EXCEL_NA_VALUES))
+        frame[column] = raw[column].map(_bool_cell) if kind == "bool" else raw[column]
+    return frame
+
+
+def _iter_sheet_rows(excel_path: Path, sheet_name: int | str) -> Iterator[tuple[object, ...]]:
+    """Restituisce le righe del foglio come tuple, senza caricarlo per intero."""
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            worksheet = workbook.worksheets[sheet_name]
+        else:
+            worksheet = workbook[sheet_name]
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _drop_trailing_blank_rows(
+    rows: Iterator[tuple[object, ...]],
+) -> Iterator[tuple[object, ...]]:
+    """Scarta le righe vuote in fondo al foglio, come ``pd.read_excel``.
+
+    Le righe con sole celle formattate ma senza valori vengono restituite da
+    openpyxl; quelle intermedie restano (pandas le mantiene come righe vuote),
+    quelle finali vengono trattenute finché non segue una riga con dati.
+    """
+
+    blank: list[tuple[object, ...]] = []
+    try:
+        for row in rows:
+            if all(value is None or value == "" for value in row):
+                blank.append(row)
+                continue
+            if blank:
+                yield from blank
+                blank.clear()
+            yield row
+    finally:
+        close = getattr(rows, "close", None)
+        if close is not None:
+            close()
+
+
+def _header_names(row: Sequence[object]) -> list[object]:
+    """Replica la gestione delle intestazioni di ``pd.read_excel``.
+
+    Le celle vuote finali vengono scartate, quelle intermedie diventano
+    ``Unnamed: <indice>`` e i duplicati ricevono il suffisso ``.1``, ``.2``…
+    """
+
+    values = list(row)
+    while values and values[-1] is None:
+        values.pop()
+
+    header: list[object] = []
+    seen: dict[object, int] = {}
+    for index, value in enumerate(values):
+        name = f"Unnamed: {index}" if value is None else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+
+def _resolve_frame_columns(
+    data_frame: pd.DataFrame,
+    *,
+    column_mapping: Mapping[str, str] | None,
+    aliases: Mapping[str, Sequence[str]] | None,
+) -> dict[str, str]:
+    """Associa i campi canonici alle colonne del DataFrame o solleva un errore."""
 
     available_columns = list(data_frame.columns)
-    preview = data_frame.head(25)
+    preview = data_frame.head(_PREVIEW_ROWS)
     column_samples: dict[str, list[str]] = {}
     for column in available_columns:
-        samples = preview[column].dropna().astype(str).head(12).tolist()
-        column_samples[column] = samples
-    resolved_columns, missing = suggest_column_mapping(
-        available_columns,
-        column_mapping=column_mapping,
-        aliases=aliases,
-        column_samples=column_samples,
+        column_samples[column] = _sample_values(preview[column])
+    resolved_columns, missing = _cached_column_mapping(
+        tuple(available_columns),
+        tuple((column_mapping or {}).items()),
+        tuple((field, tuple(names)) for field, names in (aliases or {}).items()),
+        tuple(tuple(column_samples[column]) for column in available_columns),
     )
 
     if missing:
@@ -145,70 +683,137 @@ def load_operations_from_excel(
             "Impossibile individuare tutte le colonne richieste. "
             f"Campi mancanti: {missing_fields}."
         )
+    return dict(resolved_columns)
+
+
+@lru_cache(maxsize=64)
+def _cached_column_mapping(
+    columns: tuple[str, ...],
+    column_mapping: tuple[tuple[str, str], ...],
+    aliases: tuple[tuple[str, tuple[str, ...]], ...],
+    samples: tuple[tuple[str, ...], ...],
+) -> tuple[dict[str, str], tuple[str, ...]]:
+    """Versione memorizzata di :func:`suggest_column_mapping`.
+
+    Ricaricare lo stesso file (o file con le stesse intestazioni e gli stessi
+    campioni) non ripete la ricerca di alias, parole chiave e classificatore.
+    Il dizionario restituito è condiviso: i chiamanti devono copiarlo.
+    """
 
-    normalized = data_frame.rename(
-        columns={original: field for field, original in resolved_columns.items()}
+    return suggest_column_mapping(
+        columns,
+        column_mapping=dict(column_mapping),
+        aliases=dict(aliases),
+        column_samples=dict(zip(columns, samples)),
     )
 
-    for optional_field in OPTIONAL_FIELDS:
-        if optional_field not in normalized.columns:
-            normalized[optional_field] = ""
+
+def _columns_from_frame(
+    data_frame: pd.DataFrame,
+    resolved_columns: Mapping[str, str],
+    *,
+    date_format: str | None = None,
+) -> dict[str, np.ndarray]:
+    """Converte le colonne del DataFrame negli array di :func:`load_operations_columnar`."""
+
+    import numpy as np
+    import pandas as pd
+
+    # Le colonne vengono lette per nome originale: niente ``rename`` che
+    # ricostruisce l'intero DataFrame solo per cambiare le intestazioni.
+    columns = {field: data_frame[original] for field, original in resolved_columns.items()}
 
     try:
-        normalized["date"] = pd.to_datetime(normalized["date"], errors="raise").dt.date
+        dates = _to_dates(columns["date"], date_format).to_numpy()
     except Exception as exc:  # pragma: no cover - pandas eccezioni specifiche
         raise ColumnMappingError("Colonna 'date' non convertibile in data") from exc
 
+    numeric: dict[str, np.ndarray] = {}
     for numeric_field in ("quantity", "duration_minutes"):
         try:
-            normalized[numeric_field] = pd.to_numeric(
-                normalized[numeric_field], errors="raise"
-            )
+            numeric[numeric_field] = pd.to_numeric(
+                columns[numeric_field], errors="raise"
+            ).to_numpy(dtype=np.float64)
         except Exception as exc:  # pragma: no cover
             raise ColumnMappingError(
                 f"Colonna '{numeric_field}' non convertibile in valore numerico"
             ) from exc
 
-    normalized["quantity"] = normalized["quantity"].round().astype(int)
-    normalized["duration_minutes"] = normalized["duration_minutes"].astype(float)
+    # Arrotondamento e conversione direttamente sull'array NumPy: una sola
+    # allocazione intermedia invece delle due di ``round().astype(int)``.
+    quantities = np.rint(numeric["quantity"])
+    if np.isnan(quantities).any():
+        raise ColumnMappingError("Colonna 'quantity' con valori mancanti")
+    quantities = quantities.astype(np.int64)
+
+    # Maschera booleana al posto di ``dropna``: le colonne vengono filtrate
+    # direttamente come array, senza copiare l'intero DataFrame.
+    keep = (
+        pd.notna(dates)
+        & columns["employee"].notna().to_numpy()
+        & columns["process"].notna().to_numpy()
+    )
 
-    normalized = normalized.dropna(subset=["date", "employee", "process"])
+    def text(column: pd.Series) -> np.ndarray:
+        return _coerce_text_series(column).to_numpy()[keep]
 
-    canonical_columns = list(_CANONICAL_FIELDS)
-    extras_columns = [
-        column for column in normalized.columns if column not in canonical_columns
-    ]
+    kept_rows = int(keep.sum())
 
-    records: list[OperationRecord] = []
-    for row in normalized.to_dict(orient="records"):
-        extras = {
-            column: _coerce_text(row.get(column, ""))
-            for column in extras_columns
-        }
-        records.append(
-            OperationRecord(
-                date=row["date"],
-                employee=_coerce_text(row["employee"]),
-                process=_coerce_text(row["process"]),
-                machine=_coerce_text(row.get("machine", "")),
-                process_type=_coerce_text(row.get("process_type", "")),
-                quantity=int(row["quantity"]),
-                duration_minutes=float(row["duration_minutes"]),
-                extra=extras,
-            )
-        )
+    def optional_text(field: str) -> np.ndarray:
+        if field in columns:
+            return text(columns[field])
+        return np.full(kept_rows, "", dtype=object)
+
+    result = {
+        "date": dates[keep],
+        "employee": text(columns["employee"]),
+        "process": text(columns["process"]),
+        "machine": optional_text("machine"),
+        "process_type": optional_text("process_type"),
+        "quantity": quantities[keep],
+        "duration_minutes": numeric["duration_minutes"][keep],
+    }
 
-    return records
+    mapped_columns = set(resolved_columns.values())
+    for column in data_frame.columns:
+        if column not in mapped_columns and column not in _CANONICAL_FIELDS:
+            result[column] = text(data_frame[column])
+    return result
+
+
+def _records_from_columns(columns: Mapping[str, np.ndarray]) -> list[OperationRecord]:
+    """Costruisce gli :class:`OperationRecord` dagli array di ``_columns_from_frame``."""
+
+    # Estrazione per colonna: niente dizionario intermedio per ogni riga.
+    extras_columns = [column for column in columns if column not in _RECORD_FIELDS]
+    extras_values = [columns[column].tolist() for column in extras_columns]
+    extras_rows = zip(*extras_values) if extras_values else repeat(())
+    # ``map`` con più iterabili costruisce i record in un ciclo C, passando i
+    # campi in posizione nello stesso ordine della dataclass.
+    return list(
+        map(
+            OperationRecord,
+            *(columns[field].tolist() for field in _RECORD_FIELDS),
+            map(dict, map(zip, repeat(extras_columns), extras_rows)),
+        )
+    )
 
 
 def _resolve_column_name(
     field: str,
-    available_columns: Sequence[str],
+    available_columns: Collection[str],
     *,
     column_mapping: Mapping[str, str] | None,
     aliases: Mapping[str, Sequence[str]] | None,
+    normalized_columns: Mapping[str, str],
+    normalized_column_pairs: Sequence[tuple[str, str]],
 ) -> str:
-    """Trova il nome della colonna da usare per un campo canonico."""
+    """Trova il nome della colonna da usare per un campo canonico.
+
+    ``normalized_columns`` (token normalizzato -> colonna) e
+    ``normalized_column_pairs`` (coppie token/colonna nell'ordine del file)
+    vengono calcolati una sola volta dal chiamante per tutti i campi.
+    """
 
     if column_mapping and field in column_mapping:
         candidate = column_mapping[field]
@@ -218,21 +823,20 @@ def _resolve_column_name(
             )
         return candidate
 
-    normalized_columns = {
-        _normalize_token(column): column for column in available_columns
-    }
+    # Intestazione identica al nome canonico: nessuna ricerca necessaria.
+    if field in available_columns:
+        return field
+
     alias_candidates = (aliases or {}).get(field, ())  # type: ignore[union-attr]
     for alias in alias_candidates:
         token = _normalize_token(alias)
         if token in normalized_columns:
             return normalized_columns[token]
 
-    keyword_matches = _FIELD_KEYWORDS.get(field, ())
-    for column in available_columns:
-        normalized = _normalize_token(column)
-        for keyword in keyword_matches:
-            keyword_token = _normalize_token(keyword)
-            if keyword_token and keyword_token in normalized:
+    keyword_pattern = _FIELD_KEYWORD_PATTERNS.get(field)
+    if keyword_pattern is not None:
+        for normalized, column in normalized_column_pairs:
+            if keyword_pattern.search(normalized):
                 return column
 
     raise ColumnMappingError(
@@ -244,8 +848,27 @@ def _resolve_column_name(
     )
 
 
+@lru_cache(maxsize=1024)
 def _normalize_token(value: str) -> str:
-    return value.strip().casefold()
+    text = value.strip()
+    # Per il testo ASCII ``lower`` equivale a ``casefold`` ma è più rapido.
+    return text.lower() if text.isascii() else text.casefold()
+
+
+_NORMALIZED_FIELD_KEYWORDS: dict[str, tuple[str, ...]] = {
+    field: tuple(
+        token for token in (_normalize_token(keyword) for keyword in keywords) if token
+    )
+    for field, keywords in _FIELD_KEYWORDS.items()
+}
+
+# Un'unica alternanza per campo: ogni intestazione viene scansionata una volta
+# sola dal motore regex invece di un test ``in`` per ogni parola chiave.
+_FIELD_KEYWORD_PATTERNS: dict[str, re.Pattern[str]] = {
+    field: re.compile("|".join(map(re.escape, tokens)))
+    for field, tokens in _NORMALIZED_FIELD_KEYWORDS.items()
+    if tokens
+}
 
 
 def suggest_column_mapping(
@@ -274,6 +897,13 @@ def suggest_column_mapping(
         if field in _CANONICAL_FIELDS
     }
 
+    merged_aliases = _DEFAULT_COLUMN_ALIASES | extra_aliases
+    available_set = set(available_columns)
+    normalized_column_pairs = [
+        (_normalize_token(column), column) for column in available_columns
+    ]
+    normalized_columns = dict(normalized_column_pairs)
+
     resolved: dict[str, str] = {}
     missing_required: list[str] = []
     missing_optional: list[str] = []
@@ -282,9 +912,11 @@ def suggest_column_mapping(
         try:
             resolved[field] = _resolve_column_name(
                 field,
-                available_columns,
+                available_set,
                 column_mapping=column_mapping,
-                aliases=_DEFAULT_COLUMN_ALIASES | extra_aliases,
+                aliases=merged_aliases,
+                normalized_columns=normalized_columns,
+                normalized_column_pairs=normalized_column_pairs,
             )
         except ColumnMappingError:
             missing_required.append(field)
@@ -293,9 +925,11 @@ def suggest_column_mapping(
         try:
             resolved[field] = _resolve_column_name(
                 field,
-                available_columns,
+                available_set,
                 column_mapping=column_mapping,
-                aliases=_DEFAULT_COLUMN_ALIASES | extra_aliases,
+                aliases=merged_aliases,
+                normalized_columns=normalized_columns,
+                normalized_column_pairs=normalized_column_pairs,
             )
         except ColumnMappingError:
             missing_optional.append(field)
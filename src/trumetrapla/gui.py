@@ -4,17 +4,28 @@ from __future__ import annotations
 
 from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import attrgetter, methodcaller
 from pathlib import Path
 import re
-from typing import Callable, Dict, Mapping, Protocol
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Protocol
 
 from .data_loader import (
     ColumnMappingError,
     load_operations_from_excel,
+    preview_excel_columns,
     suggest_column_mapping,
 )
 from .metrics import group_by_employee, group_by_process, summarize_operations
-from .models import OperationRecord
+from .models import OPTIONAL_FIELDS, REQUIRED_FIELDS, OperationRecord
+
+if TYPE_CHECKING:  # pragma: no cover - solo per i type checker
+    import numpy as np
+
+
+# Combinazioni di filtri di cui si conservano record filtrati e riepilogo.
+_FILTER_RESULTS_LIMIT = 16
 
 
 class GUIUnavailableError(RuntimeError):
@@ -66,6 +77,15 @@ class _AppState:
     filter_controls: "OrderedDict[str, FilterControl]" = field(
         default_factory=OrderedDict
     )
+    row_cache: dict[int, tuple[str, ...]] = field(default_factory=dict)
+    filter_codes: "dict[str, tuple[np.ndarray, dict[str, int]]]" = field(
+        default_factory=dict
+    )
+    filter_results: (
+        "dict[tuple[tuple[str, str], ...], tuple[list[OperationRecord], str]]"
+    ) = field(default_factory=dict)
+    applied_columns: tuple[str, ...] | None = None
+    displayed_rows: list[int] = field(default_factory=list)
 
 
 @dataclass
@@ -102,6 +122,7 @@ class FilterControl:
     default_label: str
     frame: object
     missing_label: str = "Non specificato"
+    options: tuple[str, ...] = ()
 
     def format_value(self, value: object) -> str:
         if value is None:
@@ -118,6 +139,42 @@ class FilterControl:
         return formatted if formatted else self.missing_label
 
 
+class _ExtraFieldAccessor:
+    """Restituisce il valore grezzo di una colonna aggiuntiva del record."""
+
+    __slots__ = ("field",)
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+
+    def __call__(self, record: OperationRecord) -> object:
+        return record.extra.get(self.field, "")
+
+
+class _ExtraFieldGetter:
+    """Valore di una colonna aggiuntiva formattato per la tabella."""
+
+    __slots__ = ("field",)
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+
+    def __call__(self, record: OperationRecord) -> str:
+        value = record.extra.get(self.field, "")
+        if value in (None, "nan"):
+            return ""
+        return str(value)
+
+
+_SLUG_SEPARATORS_RE = re.compile(r"[^0-9a-z]+")
+_SLUG_TABLE = str.maketrans(
+    {
+        chr(code): "_"
+        for code in range(128)
+        if not ("0" <= chr(code) <= "9" or "a" <= chr(code) <= "z")
+    }
+)
+
 _MATERIAL_KEYWORDS = (
     "materiale",
     "material",
@@ -226,6 +283,129 @@ def _combine_process_and_machine(record: OperationRecord) -> str:
     return f"{process} • {machine}"
 
 
+# Le colonne canoniche non dipendono dal file caricato: vengono create una
+# sola volta e condivise tra tutte le finestre e tutti i caricamenti.
+_CANONICAL_COLUMN_SPECS: tuple[ColumnSpec, ...] = (
+    ColumnSpec(
+        identifier="date",
+        label="Data",
+        getter=lambda record: record.date.strftime("%d/%m/%Y"),
+        width=110,
+        grouping_key="date",
+    ),
+    ColumnSpec(
+        identifier="employee",
+        label="Dipendente",
+        getter=lambda record: record.employee or "-",
+        anchor="w",
+        grouping_key="employee",
+    ),
+    ColumnSpec(
+        identifier="process",
+        label="Processo",
+        getter=lambda record: record.process or "-",
+        anchor="w",
+        grouping_key="process",
+    ),
+    ColumnSpec(
+        identifier="process_type",
+        label="Tipo processo",
+        getter=lambda record: record.process_type or "-",
+        anchor="w",
+        width=150,
+        grouping_key="process_type",
+    ),
+    ColumnSpec(
+        identifier="machine",
+        label="Macchina",
+        getter=lambda record: record.machine or "-",
+        anchor="w",
+        grouping_key="machine",
+    ),
+    ColumnSpec(
+        identifier="quantity",
+        label="Pezzi",
+        getter=lambda record: f"{record.quantity}",
+        width=100,
+    ),
+    ColumnSpec(
+        identifier="duration_minutes",
+        label="Durata (min)",
+        getter=lambda record: f"{record.duration_minutes:.1f}",
+        width=110,
+    ),
+    ColumnSpec(
+        identifier="throughput",
+        label="Pezzi/ora",
+        getter=lambda record: f"{record.productivity_per_hour:.2f}",
+        width=110,
+    ),
+)
+
+
+def _canonical_column_specs() -> OrderedDict[str, ColumnSpec]:
+    return OrderedDict((spec.identifier, spec) for spec in _CANONICAL_COLUMN_SPECS)
+
+
+# Raggruppamenti sempre disponibili, indipendenti dalle colonne del file.
+_BASE_GROUPINGS: tuple[tuple[str, str, Callable[[OperationRecord], object]], ...] = (
+    ("process", "Processo", lambda record: record.process or ""),
+    ("employee", "Dipendente", lambda record: record.employee or ""),
+    ("machine", "Macchina", lambda record: record.machine or ""),
+    ("process_type", "Tipo processo", lambda record: record.process_type or ""),
+    ("derived:process_machine", "Processo e macchina", _combine_process_and_machine),
+    (
+        "derived:process_family",
+        "Famiglia lavorazione (metalmeccanica)",
+        _infer_process_family,
+    ),
+    (
+        "derived:productivity_band",
+        "Classe produttività pezzi/ora",
+        _infer_productivity_band,
+    ),
+    ("derived:material_family", "Materiale lavorato", _infer_material_family),
+)
+_BASE_GROUPING_ACCESSORS: dict[str, Callable[[OperationRecord], object]] = {
+    identifier: accessor for identifier, _label, accessor in _BASE_GROUPINGS
+}
+
+
+def _encode_categories(values: list[str]) -> tuple[np.ndarray, dict[str, int]]:
+    """Codifica i valori come interi ``int32`` nell'ordine di prima comparsa.
+
+    Restituisce l'array dei codici e il dizionario valore → codice: i filtri
+    confrontano interi invece di stringhe.
+    """
+
+    import numpy as np
+
+    index: dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(value, len(index)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return codes, index
+
+
+@lru_cache(maxsize=1)
+def _matplotlib_components() -> tuple[type, type]:
+    """Importa matplotlib al primo grafico e riusa le classi nelle aperture successive.
+
+    Raises:
+        ModuleNotFoundError: se matplotlib non è installato.
+    """
+
+    if find_spec("matplotlib") is None:
+        raise ModuleNotFoundError("matplotlib non installato", name="matplotlib")
+
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+
+    return Figure, FigureCanvasTkAgg
+
+
 def _load_toolkit() -> _Toolkit:
     try:
         import tkinter as tk  # type: ignore
@@ -491,94 +671,53 @@ def launch_welcome_window(
     state = _AppState()
     loader = operations_loader or (lambda path: load_operations_from_excel(path))
 
-    def _canonical_column_specs() -> OrderedDict[str, ColumnSpec]:
-        specs: OrderedDict[str, ColumnSpec] = OrderedDict()
-        specs["date"] = ColumnSpec(
-            identifier="date",
-            label="Data",
-            getter=lambda record: record.date.strftime("%d/%m/%Y"),
-            width=110,
-            grouping_key="date",
-        )
-        specs["employee"] = ColumnSpec(
-            identifier="employee",
-            label="Dipendente",
-            getter=lambda record: record.employee or "-",
-            anchor="w",
-            grouping_key="employee",
-        )
-        specs["process"] = ColumnSpec(
-            identifier="process",
-            label="Processo",
-            getter=lambda record: record.process or "-",
-            anchor="w",
-            grouping_key="process",
-        )
-        specs["process_type"] = ColumnSpec(
-            identifier="process_type",
-            label="Tipo processo",
-            getter=lambda record: record.process_type or "-",
-            anchor="w",
-            width=150,
-            grouping_key="process_type",
-        )
-        specs["machine"] = ColumnSpec(
-            identifier="machine",
-            label="Macchina",
-            getter=lambda record: record.machine or "-",
-            anchor="w",
-            grouping_key="machine",
-        )
-        specs["quantity"] = ColumnSpec(
-            identifier="quantity",
-            label="Pezzi",
-            getter=lambda record: f"{record.quantity}",
-            width=100,
-        )
-        specs["duration_minutes"] = ColumnSpec(
-            identifier="duration_minutes",
-            label="Durata (min)",
-            getter=lambda record: f"{record.duration_minutes:.1f}",
-            width=110,
-        )
-        specs["throughput"] = ColumnSpec(
-            identifier="throughput",
-            label="Pezzi/ora",
-            getter=lambda record: f"{record.productivity_per_hour:.2f}",
-            width=110,
-        )
-        return specs
-
     state.column_specs = _canonical_column_specs()
     state.column_order = list(state.column_specs.keys())
     state.visible_columns = list(state.column_order)
 
-    def _slugify_extra(label: str, used: set[str]) -> str:
-        token = re.sub(r"[^0-9a-z]+", "_", label.lower()).strip("_")
+    def _slugify_extra(label: str, used: set[str], base_counts: dict[str, int]) -> str:
+        lowered = label.lower()
+        if lowered.isascii():
+            # ``translate`` sostituisce i separatori in un unico ciclo C; split e
+            # join comprimono le sequenze di "_" e rimuovono quelli ai bordi.
+            token = "_".join(filter(None, lowered.translate(_SLUG_TABLE).split("_")))
+        else:
+            token = _SLUG_SEPARATORS_RE.sub("_", lowered).strip("_")
         if not token:
             token = "colonna"
         base = f"extra_{token}"
-        identifier = base
-        counter = 1
+        # ``base_counts`` ricorda il prossimo suffisso libero di ogni base, così
+        # le etichette duplicate non ripartono ogni volta da ``_1``. Il controllo
+        # su ``used`` resta per i rari casi in cui una base coincide con un
+        # identificativo già generato (es. "a 1" dopo due colonne "a").
+        suffix = base_counts.get(base, 0)
+        identifier = base if suffix == 0 else f"{base}_{suffix}"
         while identifier in used:
-            identifier = f"{base}_{counter}"
-            counter += 1
+            suffix += 1
+            identifier = f"{base}_{suffix}"
+        base_counts[base] = suffix + 1
         used.add(identifier)
         return identifier
 
     def _refresh_column_specs(records: list[OperationRecord]) -> None:
+        state.row_cache.clear()
+        state.applied_columns = None
         base_specs = _canonical_column_specs()
         used_ids = set(base_specs.keys())
-        extras_order: list[str] = []
-        for record in records:
-            for key in record.extra.keys():
-                if key not in extras_order:
-                    extras_order.append(key)
+        slug_counts: dict[str, int] = {}
+        # ``dict.fromkeys`` deduplica mantenendo l'ordine di prima comparsa.
+        extras_order = list(
+            dict.fromkeys(key for record in records for key in record.extra)
+        )
 
         grouping_accessors: "OrderedDict[str, Callable[[OperationRecord], object]]" = (
-            OrderedDict()
+            OrderedDict(
+                (identifier, accessor) for identifier, _label, accessor in _BASE_GROUPINGS
+            )
+        )
+        grouping_labels: "OrderedDict[str, str]" = OrderedDict(
+            (identifier, label) for identifier, label, _accessor in _BASE_GROUPINGS
         )
-        grouping_labels: "OrderedDict[str, str]" = OrderedDict()
 
         def _register_grouping(
             identifier: str,
@@ -588,64 +727,22 @@ def launch_welcome_window(
             grouping_accessors[identifier] = accessor
             grouping_labels[identifier] = label
 
-        _register_grouping("process", "Processo", lambda record: record.process or "")
-        _register_grouping("employee", "Dipendente", lambda record: record.employee or "")
-        _register_grouping("machine", "Macchina", lambda record: record.machine or "")
-        _register_grouping(
-            "process_type",
-            "Tipo processo",
-            lambda record: record.process_type or "",
-        )
-        _register_grouping(
-            "derived:process_machine",
-            "Processo e macchina",
-            _combine_process_and_machine,
-        )
-        _register_grouping(
-            "derived:process_family",
-            "Famiglia lavorazione (metalmeccanica)",
-            _infer_process_family,
-        )
-        _register_grouping(
-            "derived:productivity_band",
-            "Classe produttività pezzi/ora",
-            _infer_productivity_band,
-        )
-        _register_grouping(
-            "derived:material_family",
-            "Materiale lavorato",
-            _infer_material_family,
-        )
-
         specs: OrderedDict[str, ColumnSpec] = OrderedDict(base_specs)
 
         for column in extras_order:
-            identifier = _slugify_extra(column, used_ids)
+            identifier = _slugify_extra(column, used_ids, slug_counts)
             grouping_key = f"extra:{column}"
 
-            def _make_getter(field: str) -> Callable[[OperationRecord], str]:
-                def _getter(record: OperationRecord, field: str = field) -> str:
-                    value = record.extra.get(field, "")
-                    if value in (None, "nan"):
-                        return ""
-                    return str(value)
-
-                return _getter
-
             specs[identifier] = ColumnSpec(
                 identifier=identifier,
                 label=column,
-                getter=_make_getter(column),
+                getter=_ExtraFieldGetter(column),
                 anchor="w",
                 width=max(140, min(len(column) * 10, 220)),
                 grouping_key=grouping_key,
                 source=column,
             )
-            _register_grouping(
-                grouping_key,
-                column,
-                lambda record, field=column: record.extra.get(field, ""),
-            )
+            _register_grouping(grouping_key, column, _ExtraFieldAccessor(column))
 
         state.column_specs = specs
         state.column_order = list(specs.keys())
@@ -694,6 +791,7 @@ def launch_welcome_window(
 
     def _configure_tree_columns() -> None:
         columns = _active_columns()
+        state.applied_columns = tuple(columns)
         tree.configure(columns=columns, displaycolumns=columns)
         for column_id in columns:
             spec = state.column_specs.get(column_id)
@@ -702,37 +800,77 @@ def launch_welcome_window(
             tree.heading(column_id, text=spec.label)
             tree.column(column_id, anchor=spec.anchor, width=spec.width)
 
+    def _format_cell(
+        getter: Callable[[OperationRecord], object] | None, record: OperationRecord
+    ) -> str:
+        if getter is None:
+            return ""
+        try:
+            value = getter(record)
+        except Exception:  # dato non valido (es. data non convertita)
+            value = ""
+        if not isinstance(value, str):
+            value = "" if value is None else str(value)
+        return value
+
     def _update_table(records: list[OperationRecord]) -> None:
-        _configure_tree_columns()
+        columns = tuple(_active_columns())
+        # Se colonne e record mostrati sono gli stessi (filtro riapplicato,
+        # conferma delle colonne senza modifiche) la tabella resta com'è.
+        displayed = list(map(id, records))
+        if state.applied_columns == columns and state.displayed_rows == displayed:
+            return
+        # Intestazioni e larghezze vengono riconfigurate solo se le colonne
+        # sono cambiate: un cambio di filtro aggiorna soltanto le righe.
+        # Le righe già formattate valgono solo per le colonne attuali.
+        if state.applied_columns != columns:
+            _configure_tree_columns()
+            state.row_cache.clear()
         tree.delete(*tree.get_children())
-        columns = _active_columns()
-        for index, record in enumerate(records):
-            values: list[str] = []
-            for column_id in columns:
-                spec = state.column_specs.get(column_id)
-                if spec is None:
-                    values.append("")
-                    continue
-                try:
-                    value = spec.getter(record)
-                except Exception:  # pragma: no cover - getter personalizzato errato
-                    value = ""
-                if not isinstance(value, str):
-                    value = "" if value is None else str(value)
-                values.append(value)
+        state.displayed_rows = []
+        getters = []
+        for column_id in columns:
+            spec = state.column_specs.get(column_id)
+            getters.append(spec.getter if spec is not None else None)
+
+        # Prima si preparano tutte le righe in Python, poi si inseriscono in
+        # blocco con ``tk.call``, evitando la conversione delle opzioni svolta
+        # da ``Treeview.insert`` per ogni riga.
+        # I record non cambiano dopo il caricamento: le righe già formattate
+        # vengono riutilizzate quando si cambia filtro.
+        row_cache = state.row_cache
+
+        def format_row(record: OperationRecord) -> tuple[str, ...]:
+            return tuple(_format_cell(getter, record) for getter in getters)
 
-            tag = "evenrow" if index % 2 == 0 else "oddrow"
-            tree.insert("", "end", values=tuple(values), tags=(tag,))
+        rows: list[tuple[str, ...]] = []
+        for record in records:
+            values = row_cache.get(id(record))
+            if values is None:
+                values = format_row(record)
+                row_cache[id(record)] = values
+            rows.append(values)
+        tags = (("evenrow",), ("oddrow",))
+        tk_call = tree.tk.call
+        widget_path = tree._w
+        for index, values in enumerate(rows):
+            tk_call(
+                widget_path,
+                "insert",
+                "",
+                "end",
+                "-values",
+                values,
+                "-tags",
+                tags[index % 2],
+            )
+        state.displayed_rows = displayed
 
     def _format_summary(records: list[OperationRecord]) -> str:
         if not records:
             return "Nessun dato disponibile"
 
         summary = summarize_operations(records)
-        machines = len({record.machine for record in records if record.machine})
-        process_types = len(
-            {record.process_type for record in records if record.process_type}
-        )
         return (
             "⟡ Record totali: {records} • Quantità: {qty} • Ore: {hours:.2f} • "
             "Throughput medio: {throughput:.2f} pezzi/ora • Dipendenti: {employees} • "
@@ -744,8 +882,8 @@ def launch_welcome_window(
             throughput=summary.throughput,
             employees=summary.employees,
             processes=summary.processes,
-            machines=machines,
-            process_types=process_types,
+            machines=summary.machines,
+            process_types=summary.process_types,
         )
 
     def _create_filter_control(
@@ -787,11 +925,12 @@ def launch_welcome_window(
             default_label=default_label,
             frame=container,
             missing_label=missing_label,
+            options=(default_label,),
         )
         state.filter_controls[identifier] = control
 
         def _on_change(*_args: object) -> None:
-            _apply_filters()
+            _schedule_apply_filters()
 
         combobox.bind("<<ComboboxSelected>>", _on_change)
         return control
@@ -800,14 +939,15 @@ def launch_welcome_window(
         control: FilterControl, records: list[OperationRecord]
     ) -> None:
         if not records:
-            control.combobox.configure(values=[control.default_label])
-            control.variable.set(control.default_label)
+            _set_filter_options(control, set())
             return
 
         values_set = {
             control.normalized_value(control.extractor(record)) for record in records
         }
+        _set_filter_options(control, values_set)
 
+    def _set_filter_options(control: FilterControl, values_set: set[str]) -> None:
         sorted_values = sorted(
             value
             for value in values_set
@@ -816,10 +956,12 @@ def launch_welcome_window(
         if control.missing_label in values_set:
             sorted_values.append(control.missing_label)
 
-        options = [control.default_label] + sorted_values if sorted_values else [
-            control.default_label
-        ]
-        control.combobox.configure(values=options)
+        options = (control.default_label, *sorted_values)
+        # Ricostruire l'elenco a tendina costa a Tk: si riconfigura solo se
+        # i valori sono cambiati rispetto all'ultimo caricamento.
+        if options != control.options:
+            control.combobox.configure(values=list(options))
+            control.options = options
         control.variable.set(control.default_label)
 
     def _available_filter_fields() -> list[tuple[str, str]]:
@@ -919,52 +1061,115 @@ def launch_welcome_window(
             )
             status_var.set("Filtri sospesi • In attesa di dati")
             tree.delete(*tree.get_children())
+            state.displayed_rows = []
             return
 
-        active_filters = [
-            control
-            for control in state.filter_controls.values()
-            if control.variable.get() not in {"", control.default_label}
-        ]
+        import numpy as np
 
-        filtered: list[OperationRecord] = []
-        for record in state.records:
-            include = True
-            for control in active_filters:
-                expected = control.variable.get()
-                record_value = control.normalized_value(control.extractor(record))
-                if record_value != expected:
-                    include = False
-                    break
-            if include:
-                filtered.append(record)
+        # Il valore selezionato viene letto una sola volta per filtro, non per
+        # ogni record: ``variable.get()`` passa dall'interprete Tcl.
+        selection = []
+        for control in state.filter_controls.values():
+            expected = control.variable.get()
+            if expected not in ("", control.default_label):
+                selection.append((control, expected))
+
+        # Record filtrati e riepilogo dipendono solo dai valori selezionati:
+        # tornare a una delle ultime combinazioni usate non ripete calcoli.
+        key = tuple((control.identifier, expected) for control, expected in selection)
+        cached = state.filter_results.pop(key, None)
+        if cached is None:
+            # Il confronto avviene sui codici interi dei valori normalizzati.
+            mask = None
+            for control, expected in selection:
+                codes, index = _filter_codes(control)
+                # Un valore mai visto riceve il codice -1, che non corrisponde a
+                # nessun record.
+                matches = codes == index.get(expected, -1)
+                mask = matches if mask is None else mask & matches
+
+            records = state.records
+            if mask is None:
+                filtered = list(records)
+            else:
+                filtered = [
+                    records[position] for position in np.flatnonzero(mask).tolist()
+                ]
+            cached = (filtered, _format_summary(filtered))
+        # La combinazione appena usata va in coda; oltre il limite si scarta
+        # quella usata meno di recente.
+        state.filter_results[key] = cached
+        if len(state.filter_results) > _FILTER_RESULTS_LIMIT:
+            del state.filter_results[next(iter(state.filter_results))]
+        filtered, summary_text = cached
 
         state.filtered_records = filtered
         _update_table(filtered)
-        summary_var.set(_format_summary(filtered))
+        summary_var.set(summary_text)
         status_var.set(
             "Filtri attivi • {visibili}/{totali} record visibili".format(
                 visibili=len(filtered), totali=len(state.records)
             )
         )
 
+    def _filter_codes(control: FilterControl) -> tuple[np.ndarray, dict[str, int]]:
+        encoded = state.filter_codes.get(control.identifier)
+        if encoded is None:
+            extractor = control.extractor
+            normalize = control.normalized_value
+            encoded = _encode_categories(
+                [normalize(extractor(record)) for record in state.records]
+            )
+            state.filter_codes[control.identifier] = encoded
+        return encoded
+
+    def _debounce(callback: Callable[[], None], delay_ms: int = 120) -> Callable[[], None]:
+        """Esegue ``callback`` una sola volta dopo l'ultimo di più eventi ravvicinati."""
+
+        pending: list[object] = []
+
+        def _run() -> None:
+            pending.clear()
+            callback()
+
+        def _schedule() -> None:
+            if pending:
+                root.after_cancel(pending.pop())
+            pending.append(root.after(delay_ms, _run))
+
+        return _schedule
+
+    # Scorrere velocemente i valori di più filtri produce un solo ricalcolo.
+    _schedule_apply_filters = _debounce(_apply_filters)
+
     def _refresh_filters(records: list[OperationRecord]) -> None:
-        for control in state.filter_controls.values():
-            _populate_filter_control(control, records)
+        state.filter_codes.clear()
+        state.filter_results.clear()
+        controls = list(state.filter_controls.values())
+        if not records or not controls:
+            for control in controls:
+                _populate_filter_control(control, records)
+            state.filtered_records = records
+            return
+
+        # Un solo passaggio sui record raccoglie i valori di tutti i filtri.
+        collectors = [
+            (control.extractor, control.normalized_value, []) for control in controls
+        ]
+        for record in records:
+            for extractor, normalize, values in collectors:
+                values.append(normalize(extractor(record)))
+        for control, (_extractor, _normalize, values) in zip(controls, collectors):
+            codes, index = _encode_categories(values)
+            state.filter_codes[control.identifier] = (codes, index)
+            _set_filter_options(control, set(index))
         state.filtered_records = records
 
     def _prompt_column_mapping(excel_path: Path) -> dict[str, str] | None:
+        # Solo intestazione e prime righe: il foglio completo viene letto una
+        # volta sola, dopo la conferma della mappatura.
         try:
-            import pandas as pd
-        except ModuleNotFoundError as exc:  # pragma: no cover - dipendenza obbligatoria
-            messagebox.showerror(
-                "Pandas non disponibile",
-                "Installa la dipendenza 'pandas' per importare file Excel.",
-            )
-            raise GUIUnavailableError("Pandas richiesto per la gestione dei file Excel") from exc
-
-        try:
-            preview = pd.read_excel(excel_path, sheet_name=0, nrows=25)
+            columns, column_samples = preview_excel_columns(excel_path)
         except Exception as exc:  # pragma: no cover - errori di I/O imprevisti
             messagebox.showerror(
                 "Errore di lettura",
@@ -972,7 +1177,6 @@ def launch_welcome_window(
             )
             return None
 
-        columns = list(preview.columns)
         if not columns:
             messagebox.showerror(
                 "Intestazioni mancanti",
@@ -980,10 +1184,6 @@ def launch_welcome_window(
             )
             return None
 
-        column_samples = {
-            column: preview[column].dropna().astype(str).head(12).tolist()
-            for column in columns
-        }
         suggestions, _missing = suggest_column_mapping(
             columns, column_samples=column_samples
         )
@@ -995,6 +1195,8 @@ def launch_welcome_window(
             "process": "Processo",
             "quantity": "Quantità prodotta",
             "duration_minutes": "Durata in minuti",
+            "machine": "Macchina",
+            "process_type": "Tipo processo",
         }
 
         dialog = tk.Toplevel(root)
@@ -1274,8 +1476,7 @@ def launch_welcome_window(
             return
 
         try:
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            from matplotlib.figure import Figure
+            Figure, FigureCanvasTkAgg = _matplotlib_components()
         except ModuleNotFoundError:  # pragma: no cover - dipendenza opzionale
             messagebox.showerror(
                 "Matplotlib non disponibile",
@@ -1384,21 +1585,36 @@ def launch_welcome_window(
                 return text if text else "Non specificato"
             return str(value)
 
-        def _build_breakdown(identifier: str) -> list[tuple[str, int]]:
+        # I record del grafico sono fissati all'apertura della finestra: tornare
+        # a un raggruppamento già visto non ripete il calcolo.
+        @lru_cache(maxsize=None)
+        def _build_breakdown(identifier: str) -> tuple[tuple[str, int], ...]:
             accessor = state.grouping_accessors.get(identifier)
             if accessor is None:
-                return []
+                return ()
+            # Le colonne aggiuntive vengono lette con ``methodcaller`` in un ciclo
+            # C, senza chiamare un accessor Python per ogni record; la
+            # normalizzazione avviene poi una sola volta per valore distinto.
+            if isinstance(accessor, _ExtraFieldAccessor):
+                values = map(
+                    methodcaller("get", accessor.field, ""),
+                    map(attrgetter("extra"), records),
+                )
+            else:
+                values = map(accessor, records)
+            raw_totals: dict[object, int] = defaultdict(int)
+            for value, quantity in zip(values, map(attrgetter("quantity"), records)):
+                raw_totals[value] += quantity
             totals: dict[str, int] = defaultdict(int)
-            for record in records:
-                label = _normalize_group_value(accessor(record))
-                totals[label] += record.quantity
+            for value, quantity in raw_totals.items():
+                totals[_normalize_group_value(value)] += quantity
             breakdown = [
                 (label, quantity)
                 for label, quantity in totals.items()
                 if quantity > 0
             ]
             breakdown.sort(key=lambda item: item[1], reverse=True)
-            return breakdown
+            return tuple(breakdown)
 
         def _refresh_chart(*_args: object) -> None:
             selected_label = grouping_combo.get()
@@ -1417,11 +1633,14 @@ def launch_welcome_window(
 
             values = [quantity for _label, quantity in breakdown]
             labels = [label for label, _quantity in breakdown]
-            total = sum(values)
+
+            # ``pie`` chiama ``autopct`` una volta per spicchio, nello stesso
+            # ordine dei valori: le quantità sono già note e non vanno
+            # ricalcolate dalla percentuale.
+            absolute_values = iter(values)
 
             def _format_pct(pct: float) -> str:
-                absolute = int(round(pct * total / 100.0))
-                return f"{pct:.1f}% ({absolute} pezzi)"
+                return f"{pct:.1f}% ({next(absolute_values)} pezzi)"
 
             axis.pie(
                 values,
@@ -1597,28 +1816,28 @@ def launch_welcome_window(
         (
             "employee",
             "Dipendente",
-            lambda record: record.employee or "",
+            _BASE_GROUPING_ACCESSORS["employee"],
             "Tutti",
             28,
         ),
         (
             "process",
             "Processo",
-            lambda record: record.process or "",
+            _BASE_GROUPING_ACCESSORS["process"],
             "Tutti",
             28,
         ),
         (
             "machine",
             "Macchina",
-            lambda record: record.machine or "",
+            _BASE_GROUPING_ACCESSORS["machine"],
             "Tutte",
             24,
         ),
         (
             "process_type",
             "Tipo processo",
-            lambda record: record.process_type or "",
+            _BASE_GROUPING_ACCESSORS["process_type"],
             "Tutte",
             24,
         ),
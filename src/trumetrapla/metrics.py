@@ -20,6 +20,8 @@ class Summary:
     throughput: float
     employees: int
     processes: int
+    machines: int = 0
+    process_types: int = 0
 
 
 @dataclass(frozen=True, slots=True)
@@ -45,18 +47,32 @@ class DailyTotals:
 def summarize_operations(records: Iterable[OperationRecord]) -> Summary:
     """Ritorna un riepilogo complessivo delle lavorazioni fornite."""
 
-    records_list = list(records)
-    total_quantity = sum(record.quantity for record in records_list)
-    total_hours = sum(record.hours for record in records_list)
+    # Un solo passaggio sui record: totali e valori distinti insieme.
+    total_quantity = 0
+    total_hours = 0.0
+    employees: set[str] = set()
+    processes: set[str] = set()
+    machines: set[str] = set()
+    process_types: set[str] = set()
+    for record in records:
+        total_quantity += record.quantity
+        total_hours += record.hours
+        employees.add(record.employee)
+        processes.add(record.process)
+        machines.add(record.machine)
+        process_types.add(record.process_type)
+    # Macchina e tipo di processo sono facoltativi: il valore vuoto non conta.
+    machines.discard("")
+    process_types.discard("")
     throughput = total_quantity / total_hours if total_hours else 0.0
-    employees = len({record.employee for record in records_list})
-    processes = len({record.process for record in records_list})
     return Summary(
         total_quantity=total_quantity,
         total_hours=total_hours,
         throughput=throughput,
-        employees=employees,
-        processes=processes,
+        employees=len(employees),
+        processes=len(processes),
+        machines=len(machines),
+        process_types=len(process_types),
     )
 
 
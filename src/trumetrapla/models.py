@@ -6,6 +6,17 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Mapping
 
+# Campi canonici di una lavorazione: quelli obbligatori devono essere presenti
+# in ogni file importato, quelli facoltativi vengono lasciati vuoti se assenti.
+REQUIRED_FIELDS = (
+    "date",
+    "employee",
+    "process",
+    "quantity",
+    "duration_minutes",
+)
+OPTIONAL_FIELDS = ("machine", "process_type")
+
 
 @dataclass(frozen=True, slots=True)
 class OperationRecord:
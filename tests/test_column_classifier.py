@@ -0,0 +1,55 @@
+import pytest
+
+from trumetrapla.column_classifier import (
+    DEFAULT_TRAINING_DATA,
+    NaiveBayesColumnClassifier,
+    _tokenize,
+    analyse_samples,
+    build_default_guesser,
+)
+
+
+def test_score_tokens_matches_score():
+    classifier = NaiveBayesColumnClassifier(DEFAULT_TRAINING_DATA)
+    samples = ["Mario Rossi", "Luigi Verdi"]
+    tokens = _tokenize("Operatore") + _tokenize(" ".join(samples))
+
+    for field in DEFAULT_TRAINING_DATA:
+        expected = classifier.score(field, header="Operatore", samples=samples)
+        assert classifier.score_tokens(field, tokens) == pytest.approx(expected)
+
+
+def test_analyse_samples_counts_numeric_and_dates():
+    metadata = analyse_samples(["12", "1,5", "2024-01-01", "testo", "", None])
+
+    assert metadata["numeric_ratio"] == pytest.approx(2 / 6)
+    assert metadata["date_like_ratio"] == pytest.approx(1 / 6)
+
+
+def test_guess_picks_numeric_column_for_quantity():
+    guesser = build_default_guesser()
+    columns = {
+        "Tot output": ["64", "48", "51"],
+        "Team member": ["Giulia Neri", "Luca Blu", "Anna Bianchi"],
+    }
+
+    guess, _score = guesser.guess(field="quantity", columns=columns, already_assigned=set())
+
+    assert guess == "Tot output"
+
+
+def test_guess_skips_columns_without_numeric_samples_for_quantity():
+    guesser = build_default_guesser()
+    columns = {
+        "Numero pezzi": ["molti", "pochi", "nessuno"],
+        "Note": ["urgente", "standard", "standard"],
+    }
+
+    guess, score = guesser.guess(field="quantity", columns=columns, already_assigned=set())
+
+    assert guess is None
+    assert score == float("-inf")
+
+
+def test_build_default_guesser_is_shared():
+    assert build_default_guesser() is build_default_guesser()
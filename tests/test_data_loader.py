@@ -2,9 +2,15 @@
 import pandas as pd
 import pytest
 
+from trumetrapla import data_loader
 from trumetrapla.data_loader import (
     ColumnMappingError,
+    _cached_column_mapping,
+    _sample_values,
+    iter_operations_from_excel,
+    load_operations_columnar,
     load_operations_from_excel,
+    preview_excel_columns,
     suggest_column_mapping,
 )
 
@@ -106,6 +112,32 @@ def test_missing_column_raises_error(tmp_path):
         load_operations_from_excel(excel_path)
 
 
+def test_missing_quantity_value_raises_error(tmp_path):
+    frame = pd.DataFrame(
+        [
+            {
+                "Data": "2024-01-01",
+                "Operatore": "Mario Rossi",
+                "Processo": "Taglio",
+                "Pezzi prodotti": 10.6,
+                "Durata (min)": 30,
+            },
+            {
+                "Data": "2024-01-02",
+                "Operatore": "Anna Bianchi",
+                "Processo": "Taglio",
+                "Pezzi prodotti": None,
+                "Durata (min)": 45,
+            },
+        ]
+    )
+    excel_path = tmp_path / "quantita.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    with pytest.raises(ColumnMappingError):
+        load_operations_from_excel(excel_path)
+
+
 def test_suggest_column_mapping_returns_resolved_headers():
     columns = ["Data", "Operatore", "Linea", "Pezzi prodotti", "Durata (min)"]
 
@@ -157,3 +189,222 @@ def test_auto_mapping_works_with_unconventional_headers(tmp_path):
     assert {record.process_type for record in records} == {"Verifica", "Logistica"}
     assert records[0].quantity == 64
     assert pytest.approx(records[0].duration_minutes, rel=1e-3) == 52
+
+
+def test_suggest_column_mapping_prefers_exact_canonical_headers():
+    columns = ["Fase", "process", "date", "employee", "quantity", "duration_minutes"]
+
+    resolved, missing = suggest_column_mapping(columns)
+
+    assert missing == ()
+    assert resolved["process"] == "process"
+    assert resolved["date"] == "date"
+
+
+def test_iter_operations_matches_full_load(tmp_path):
+    frame = pd.DataFrame(
+        [
+            {
+                "Data": f"2024-01-{day:02d}",
+                "Operatore": name,
+                "Processo": "Taglio",
+                "Pezzi prodotti": 10 * day,
+                "Durata (min)": 30,
+                "Turno": "Notte",
+            }
+            for day, name in zip(range(1, 8), ["Mario", "nan", "Anna", None, "Luca", "", "Sara"])
+        ]
+    )
+    excel_path = tmp_path / "operazioni.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    streamed = list(iter_operations_from_excel(excel_path, chunk_size=2))
+
+    assert streamed == load_operations_from_excel(excel_path)
+    assert [record.employee for record in streamed] == ["Mario", "Anna", "Luca", "Sara"]
+
+
+def test_repeated_load_reuses_column_mapping(tmp_path):
+    frame = pd.DataFrame(
+        [
+            {
+                "Data": "2024-03-01",
+                "Operatore": "Mario Rossi",
+                "Processo": "Taglio",
+                "Pezzi prodotti": 12,
+                "Durata (min)": 30,
+            }
+        ]
+    )
+    excel_path = tmp_path / "ripetuto.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    first = load_operations_from_excel(excel_path)
+    hits = _cached_column_mapping.cache_info().hits
+    second = load_operations_from_excel(excel_path)
+
+    assert second == first
+    assert _cached_column_mapping.cache_info().hits == hits + 1
+
+
+def test_load_operations_columnar_matches_records(tmp_path):
+    frame = pd.DataFrame(
+        [
+            {
+                "Data": "2024-04-01",
+                "Operatore": "Mario Rossi",
+                "Processo": "Taglio",
+                "Pezzi prodotti": 12.4,
+                "Durata (min)": 30,
+                "Turno": "Notte",
+            },
+            {
+                "Data": "2024-04-02",
+                "Operatore": None,
+                "Processo": "Taglio",
+                "Pezzi prodotti": 8,
+                "Durata (min)": 20,
+                "Turno": "Giorno",
+            },
+        ]
+    )
+    excel_path = tmp_path / "colonne.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    columns = load_operations_columnar(excel_path)
+    records = load_operations_from_excel(excel_path)
+
+    assert columns["quantity"].dtype == "int64"
+    assert columns["duration_minutes"].dtype == "float64"
+    assert columns["employee"].tolist() == [record.employee for record in records]
+    assert columns["quantity"].tolist() == [12]
+    assert columns["date"].tolist() == [record.date for record in records]
+
+
+def test_preview_excel_columns_reads_headers_and_samples(tmp_path):
+    frame = pd.DataFrame(
+        {
+            "Operatore": ["Mario Rossi", None, "Anna Bianchi"] + ["Luca Blu"] * 40,
+            "Note": ["nan", "urgente", None] + ["standard"] * 40,
+        }
+    )
+    excel_path = tmp_path / "anteprima.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    columns, samples = preview_excel_columns(excel_path)
+
+    assert columns == ["Operatore", "Note"]
+    assert samples["Operatore"][:3] == ["Mario Rossi", "Anna Bianchi", "Luca Blu"]
+    assert samples["Note"][:2] == ["urgente", "standard"]
+    assert all(len(values) == 12 for values in samples.values())
+
+
+def test_iter_operations_ignores_trailing_formatted_rows(tmp_path):
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["Data", "Operatore", "Processo", "Pezzi prodotti", "Durata (min)"])
+    sheet.append(["2024-01-02", "Mario", "Taglio", 10, 30])
+    sheet.append(["2024-01-03", "Anna", "Piegatura", 12, 45])
+    for row in range(4, 8):
+        for column in range(1, 6):
+            sheet.cell(row=row, column=column).font = Font(bold=True)
+    excel_path = tmp_path / "formattato.xlsx"
+    workbook.save(excel_path)
+
+    streamed = list(iter_operations_from_excel(excel_path))
+
+    assert len(streamed) == 2
+    assert streamed == load_operations_from_excel(excel_path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10_000])
+def test_iter_operations_parses_text_dates_like_full_load(tmp_path, chunk_size):
+    frame = pd.DataFrame(
+        {
+            "Data": ["13/01/2024", "02/03/2024", "05/04/2024", "14/02/2024"],
+            "Operatore": ["Mario", "Anna", "Luca", "Sara"],
+            "Processo": "Taglio",
+            "Pezzi prodotti": [10, 12, 14, 16],
+            "Durata (min)": 30,
+        }
+    )
+    excel_path = tmp_path / "date_testo.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    with pytest.warns(UserWarning):
+        expected = load_operations_from_excel(excel_path)
+    streamed = list(iter_operations_from_excel(excel_path, chunk_size=chunk_size))
+
+    assert streamed == expected
+    assert [record.date.isoformat() for record in streamed] == [
+        "2024-01-13",
+        "2024-03-02",
+        "2024-04-05",
+        "2024-02-14",
+    ]
+
+
+def test_iter_operations_keeps_sheet_column_types(tmp_path):
+    frame = pd.DataFrame(
+        {
+            "Data": ["2024-01-02", "2024-01-03", "2024-01-04"],
+            "Operatore": ["Mario", "Anna", "Luca"],
+            "Processo": "Taglio",
+            "Pezzi prodotti": [10, 12, 14],
+            "Durata (min)": 30,
+            "Commessa": [123, None, 2.5],
+            "Flag": [1, None, 0],
+        }
+    )
+    excel_path = tmp_path / "commesse.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    records = load_operations_from_excel(excel_path)
+
+    assert [record.extra["Commessa"] for record in records] == ["123.0", "", "2.5"]
+    assert [record.extra["Flag"] for record in records] == ["1.0", "", "0.0"]
+    assert [record.machine for record in records] == ["", "", ""]
+    assert list(iter_operations_from_excel(excel_path, chunk_size=1)) == records
+
+
+def test_preview_samples_match_read_excel(tmp_path):
+    frame = pd.DataFrame(
+        {
+            "Data": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]),
+            "Operatore": ["Mario", "Anna", None],
+            "Processo": "Taglio",
+            "Pezzi prodotti": [10, None, 14],
+            "Durata (min)": [30, 45.5, 60],
+            "Flag": [1, None, 0],
+        }
+    )
+    excel_path = tmp_path / "anteprima_tipi.xlsx"
+    frame.to_excel(excel_path, index=False)
+
+    columns, samples = preview_excel_columns(excel_path)
+    loaded = pd.read_excel(excel_path, nrows=25)
+
+    assert columns == list(loaded.columns)
+    assert samples == {column: _sample_values(loaded[column]) for column in columns}
+    assert samples["Pezzi prodotti"] == ["10.0", "14.0"]
+    mapping, _missing = suggest_column_mapping(columns, column_samples=samples)
+    assert "Flag" not in mapping.values()
+
+
+def test_iter_operations_loads_other_formats_with_pandas(tmp_path, monkeypatch):
+    excel_path = tmp_path / "storico.xls"
+    excel_path.write_bytes(b"")
+    expected = [object()]
+    calls = []
+
+    def fake_load(path, **kwargs):
+        calls.append((path, kwargs["sheet_name"]))
+        return expected
+
+    monkeypatch.setattr(data_loader, "load_operations_from_excel", fake_load)
+
+    assert list(iter_operations_from_excel(excel_path, sheet_name=1)) == expected
+    assert calls == [(excel_path, 1)]
@@ -4,7 +4,11 @@ from pathlib import Path
 
 import pytest
 
-from trumetrapla.gui import GUIUnavailableError, launch_welcome_window
+from trumetrapla import gui
+from trumetrapla.gui import (
+    GUIUnavailableError,
+    launch_welcome_window,
+)
 from trumetrapla.models import OperationRecord
 
 
@@ -54,6 +58,17 @@ class DummyRoot:
         self.configure_calls: list[dict[str, object]] = []
         self.config_calls: list[dict[str, object]] = []
         self.mainloop_called = False
+        self.scheduled: dict[str, object] = {}
+        self._next_after = 0
+
+    def after(self, _delay_ms: int, callback) -> str:
+        identifier = f"after#{self._next_after}"
+        self._next_after += 1
+        self.scheduled[identifier] = callback
+        return identifier
+
+    def after_cancel(self, identifier: str) -> None:
+        self.scheduled.pop(identifier, None)
 
     def title(self, value: str) -> None:
         self.title_value = value
@@ -133,8 +148,11 @@ class DummyCombobox(DummyWidget):
 
 
 class DummyTreeview(DummyWidget):
+    instances: list["DummyTreeview"] = []
+
     def __init__(self, *args, columns=(), **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        DummyTreeview.instances.append(self)
         self.columns = columns
         self.headings: dict[str, str] = {}
         self.column_options: dict[str, dict[str, object]] = {}
@@ -142,6 +160,14 @@ class DummyTreeview(DummyWidget):
         self._next_id = 0
         self.yscroll = None
         self.xscroll = None
+        self._w = f".treeview{len(DummyTreeview.instances)}"
+        self.tk = types.SimpleNamespace(call=self._tk_call)
+
+    def _tk_call(self, widget_path: str, command: str, *args):
+        assert widget_path == self._w
+        assert command == "insert"
+        options = dict(zip(args[2::2], args[3::2]))
+        return self.insert(*args[:2], values=options["-values"])
 
     def heading(self, column: str, text: str) -> None:
         self.headings[column] = text
@@ -238,6 +264,7 @@ class DummyTkModule:
 class DummyToolkit(dict):
     def __init__(self) -> None:
         DummyLabel.instances = []
+        DummyTreeview.instances = []
         self.tk_module = DummyTkModule()
         self.messagebox = DummyMessagebox()
         self.filedialog = DummyFileDialog()
@@ -357,3 +384,262 @@ def test_launch_welcome_window_requires_valid_toolkit():
             run_mainloop=False,
             _toolkit={"tk": None, "ttk": None, "messagebox": None, "filedialog": None},
         )
+
+
+def test_apply_filters_keeps_matching_records():
+    toolkit = DummyToolkit()
+    sample_records = [
+        OperationRecord(
+            date=date(2024, 6, 1),
+            employee="Anna",
+            process="Taglio",
+            machine="Laser 1",
+            process_type="Taglio",
+            quantity=10,
+            duration_minutes=60,
+        ),
+        OperationRecord(
+            date=date(2024, 6, 2),
+            employee="Luca",
+            process="Taglio",
+            machine="",
+            process_type="Taglio",
+            quantity=8,
+            duration_minutes=90,
+        ),
+    ]
+    toolkit.filedialog.return_value = "C:/dati.xlsx"
+
+    handles = launch_welcome_window(
+        run_mainloop=False,
+        operations_loader=lambda _path: sample_records,
+        _toolkit=toolkit,
+    )
+    handles.commands["open_file"]()
+
+    controls = handles.state.filter_controls
+    controls["machine"].variable.set("Non specificato")
+    handles.commands["apply_filters"]()
+    assert handles.state.filtered_records == [sample_records[1]]
+
+    controls["machine"].variable.set(controls["machine"].default_label)
+    controls["employee"].variable.set("Anna")
+    handles.commands["apply_filters"]()
+    assert handles.state.filtered_records == [sample_records[0]]
+
+    controls["employee"].variable.set(controls["employee"].default_label)
+    controls["machine"].variable.set("Non specificato")
+    handles.commands["apply_filters"]()
+    assert handles.state.filtered_records == [sample_records[1]]
+
+
+def test_table_leaves_blank_cells_that_cannot_be_formatted():
+    toolkit = DummyToolkit()
+    sample_records = [
+        OperationRecord(
+            date="03/07/2024",  # type: ignore[arg-type]
+            employee="Anna",
+            process="Taglio",
+            machine="",
+            process_type="Taglio",
+            quantity=42,
+            duration_minutes=75,
+        ),
+    ]
+    toolkit.filedialog.return_value = "C:/dati.xlsx"
+
+    handles = launch_welcome_window(
+        run_mainloop=False,
+        operations_loader=lambda _path: sample_records,
+        _toolkit=toolkit,
+    )
+    handles.commands["open_file"]()
+    (tree,) = DummyTreeview.instances
+    (values,) = tree.items.values()
+    assert values[0] == ""
+    assert values[1] == "Anna"
+
+    handles.commands["apply_filters"]()
+    assert list(tree.items.values()) == [values]
+
+
+def test_reloading_same_values_does_not_rebuild_filter_options():
+    toolkit = DummyToolkit()
+    sample_records = [
+        OperationRecord(
+            date=date(2024, 6, 1),
+            employee="Anna",
+            process="Taglio",
+            machine="Laser 1",
+            process_type="Taglio",
+            quantity=10,
+            duration_minutes=60,
+        ),
+    ]
+    toolkit.filedialog.return_value = "C:/dati.xlsx"
+
+    handles = launch_welcome_window(
+        run_mainloop=False,
+        operations_loader=lambda _path: sample_records,
+        _toolkit=toolkit,
+    )
+    handles.commands["open_file"]()
+    combobox = handles.state.filter_controls["employee"].combobox
+    assert combobox.values == ["Tutti", "Anna"]
+    calls = len(combobox.configure_calls)
+
+    handles.commands["open_file"]()
+
+    assert len(combobox.configure_calls) == calls
+    assert handles.state.filter_controls["employee"].variable.get() == "Tutti"
+
+
+def test_reapplying_same_filters_keeps_table_rows():
+    toolkit = DummyToolkit()
+    sample_records = [
+        OperationRecord(
+            date=date(2024, 6, 1),
+            employee="Anna",
+            process="Taglio",
+            machine="Laser 1",
+            process_type="Taglio",
+            quantity=10,
+            duration_minutes=60,
+        ),
+        OperationRecord(
+            date=date(2024, 6, 2),
+            employee="Luca",
+            process="Piega",
+            machine="Pressa 2",
+            process_type="Piega",
+            quantity=8,
+            duration_minutes=90,
+        ),
+    ]
+    toolkit.filedialog.return_value = "C:/dati.xlsx"
+
+    handles = launch_welcome_window(
+        run_mainloop=False,
+        operations_loader=lambda _path: sample_records,
+        _toolkit=toolkit,
+    )
+    handles.commands["open_file"]()
+    (tree,) = DummyTreeview.instances
+    shown = list(tree.items)
+    assert len(shown) == 2
+
+    handles.commands["apply_filters"]()
+    assert list(tree.items) == shown
+
+    handles.state.filter_controls["employee"].variable.set("Luca")
+    handles.commands["apply_filters"]()
+    assert [values[1] for values in tree.items.values()] == ["Luca"]
+
+
+def test_filter_selection_is_applied_once_after_last_change():
+    toolkit = DummyToolkit()
+    sample_records = [
+        OperationRecord(
+            date=date(2024, 6, 1),
+            employee="Anna",
+            process="Taglio",
+            machine="Laser 1",
+            process_type="Taglio",
+            quantity=10,
+            duration_minutes=60,
+        ),
+        OperationRecord(
+            date=date(2024, 6, 2),
+            employee="Luca",
+            process="Piega",
+            machine="Pressa 2",
+            process_type="Piega",
+            quantity=8,
+            duration_minutes=90,
+        ),
+    ]
+    toolkit.filedialog.return_value = "C:/dati.xlsx"
+
+    handles = launch_welcome_window(
+        run_mainloop=False,
+        operations_loader=lambda _path: sample_records,
+        _toolkit=toolkit,
+    )
+    handles.commands["open_file"]()
+    (tree,) = DummyTreeview.instances
+    control = handles.state.filter_controls["employee"]
+    ((_event, on_change),) = control.combobox.bind_calls
+
+    control.variable.set("Anna")
+    on_change()
+    control.variable.set("Luca")
+    on_change()
+
+    assert len(tree.items) == 2
+    (callback,) = handles.root.scheduled.values()
+    callback()
+    assert [values[1] for values in tree.items.values()] == ["Luca"]
+
+
+def test_row_cache_keeps_only_current_columns():
+    toolkit = DummyToolkit()
+    sample_records = [
+        OperationRecord(
+            date=date(2024, 6, 1),
+            employee="Anna",
+            process="Taglio",
+            machine="Laser 1",
+            process_type="Taglio",
+            quantity=10,
+            duration_minutes=60,
+        ),
+    ]
+    toolkit.filedialog.return_value = "C:/dati.xlsx"
+
+    handles = launch_welcome_window(
+        run_mainloop=False,
+        operations_loader=lambda _path: sample_records,
+        _toolkit=toolkit,
+    )
+    handles.commands["open_file"]()
+    (tree,) = DummyTreeview.instances
+
+    handles.state.visible_columns = ["employee", "quantity"]
+    handles.commands["apply_filters"]()
+
+    assert list(tree.items.values()) == [("Anna", "10")]
+    assert list(handles.state.row_cache.values()) == [("Anna", "10")]
+
+
+def test_filter_results_keep_only_recent_combinations(monkeypatch):
+    monkeypatch.setattr(gui, "_FILTER_RESULTS_LIMIT", 2)
+    toolkit = DummyToolkit()
+    sample_records = [
+        OperationRecord(
+            date=date(2024, 6, day),
+            employee=employee,
+            process="Taglio",
+            machine="Laser 1",
+            process_type="Taglio",
+            quantity=10,
+            duration_minutes=60,
+        )
+        for day, employee in enumerate(("Anna", "Luca", "Sara"), start=1)
+    ]
+    toolkit.filedialog.return_value = "C:/dati.xlsx"
+
+    handles = launch_welcome_window(
+        run_mainloop=False,
+        operations_loader=lambda _path: sample_records,
+        _toolkit=toolkit,
+    )
+    handles.commands["open_file"]()
+    variable = handles.state.filter_controls["employee"].variable
+    for employee in ("Anna", "Luca", "Anna", "Sara"):
+        variable.set(employee)
+        handles.commands["apply_filters"]()
+
+    assert list(handles.state.filter_results) == [
+        (("employee", "Anna"),),
+        (("employee", "Sara"),),
+    ]
@@ -51,6 +51,8 @@ def test_summarize_operations():
     assert summary.total_quantity == 260
     assert summary.employees == 2
     assert summary.processes == 3
+    assert summary.machines == 3
+    assert summary.process_types == 3
     assert summary.total_hours == pytest.approx(4.5, rel=1e-3)
     assert summary.throughput == pytest.approx(57.777, rel=1e-3)
 